@@ -0,0 +1,165 @@
+"""
+Benchmark do núcleo de Brandes: kernel anterior (dicionários e listas novos a
+cada origem + ordenação por distância) contra _brandes_chunk (buffers planos
+reaproveitados, pilha na ordem de fixação, predecessores em buffer encadeado).
+Mede o melhor tempo de algumas repetições e, com tracemalloc, o pico de memória
+alocada durante a varredura.
+
+Uso: python benchmarks/bench_brandes.py [--vertices 5000] [--edges 25000] [--sources 300] [--repeat 3]
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.AdjacencyListGraph import AdjacencyListGraph, MAX_BUCKET_WEIGHT
+
+
+# --- Kernel anterior: caminhos mínimos com dicionários/listas novos a cada origem ---
+
+def caminhos_bfs(graph, start):
+    """Caminhos mínimos por BFS (pesos unitários)."""
+    distances = [math.inf] * graph.num_vertices
+    distances[start] = 0
+    predecessors = {start: []}
+    shortest_path_count = [0] * graph.num_vertices
+    shortest_path_count[start] = 1
+    queue = deque([start])
+    while queue:
+        u = queue.popleft()
+        next_distance = distances[u] + 1
+        for v in graph.successors(u):
+            if distances[v] == math.inf:
+                distances[v] = next_distance
+                predecessors[v] = [u]
+                shortest_path_count[v] = shortest_path_count[u]
+                queue.append(v)
+            elif distances[v] == next_distance:
+                predecessors[v].append(u)
+                shortest_path_count[v] += shortest_path_count[u]
+    return distances, predecessors, shortest_path_count
+
+
+def caminhos_dial(graph, start):
+    """Caminhos mínimos com a fila de baldes de Dial (pesos inteiros pequenos)."""
+    distances = [math.inf] * graph.num_vertices
+    distances[start] = 0
+    predecessors = {start: []}
+    shortest_path_count = [0] * graph.num_vertices
+    shortest_path_count[start] = 1
+    ring_size = MAX_BUCKET_WEIGHT + 1
+    buckets = [[] for _ in range(ring_size)]
+    buckets[0].append(start)
+    pending = 1
+    current_distance = 0
+    while pending:
+        bucket = buckets[current_distance % ring_size]
+        while not bucket:
+            current_distance += 1
+            bucket = buckets[current_distance % ring_size]
+        u = bucket.pop()
+        pending -= 1
+        if distances[u] != current_distance:
+            continue
+        for v, weight in graph.out_edges(u):
+            distance = current_distance + int(weight)
+            if distance < distances[v]:
+                distances[v] = distance
+                predecessors[v] = [u]
+                shortest_path_count[v] = shortest_path_count[u]
+                buckets[distance % ring_size].append(v)
+                pending += 1
+            elif distance == distances[v]:
+                predecessors[v].append(u)
+                shortest_path_count[v] += shortest_path_count[u]
+    return distances, predecessors, shortest_path_count
+
+
+def caminhos_minimos(graph, start):
+    profile = graph._weight_profile()
+    if profile == 'unit':
+        return caminhos_bfs(graph, start)
+    if profile == 'int':
+        return caminhos_dial(graph, start)
+    return graph._dijkstra_paths(start)
+
+
+def kernel_anterior(graph, sources):
+    """Acumulação de Brandes como era feita antes (mesmo resultado, outra estratégia)."""
+    num_nodes = graph.num_vertices
+    node_partial = array('d', bytes(8 * num_nodes))
+    for s in sources:
+        distances, predecessors, shortest_path_count = caminhos_minimos(graph, s)
+        order = [v for v in range(num_nodes) if v != s and distances[v] != float('inf')]
+        order.sort(key=lambda v: distances[v])
+        dependency = {v: 0.0 for v in order}
+        dependency[s] = 0.0
+        for w in reversed(order):
+            for v in predecessors[w]:
+                dependency[v] += shortest_path_count[v] / shortest_path_count[w] * (1.0 + dependency[w])
+            node_partial[w] += dependency[w]
+    return node_partial
+
+
+def kernel_atual(graph, sources):
+    node_partial, _, _ = graph._brandes_chunk(sources, node=True)
+    return node_partial
+
+
+def gerar_grafo(num_vertices, num_edges, weights, seed):
+    rng = random.Random(seed)
+    graph = AdjacencyListGraph(num_vertices)
+    graph.add_edges_from((rng.randrange(num_vertices), rng.randrange(num_vertices), rng.choice(weights))
+                         for _ in range(num_edges))
+    return graph
+
+
+def medir(nome, func, graph, sources, repeat):
+    elapsed = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        scores = func(graph, sources)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    # Memória medida em uma execução separada, para não distorcer o tempo
+    tracemalloc.start()
+    func(graph, sources[:max(1, len(sources) // 10)])
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {nome:<16} {elapsed:8.3f} s   pico {peak / 1024:10.1f} KiB")
+    return elapsed, peak, scores
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--vertices', type=int, default=5_000)
+    parser.add_argument('--edges', type=int, default=25_000)
+    parser.add_argument('--sources', type=int, default=300)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    cenarios = (("pesos unitários (BFS)", (1.0,)),
+                ("pesos inteiros (Dial)", (2.0, 3.0, 4.0, 5.0)),
+                ("pesos reais (Dijkstra)", (0.5, 1.25, 2.75)))
+    for nome, weights in cenarios:
+        graph = gerar_grafo(args.vertices, args.edges, weights, args.seed)
+        sources = list(range(min(args.sources, args.vertices)))
+        print(f"{nome}: {args.vertices} vértices, {graph.get_edge_count()} arestas, {len(sources)} origens")
+        t_old, peak_old, old = medir("kernel anterior", kernel_anterior, graph, sources, args.repeat)
+        t_new, peak_new, new = medir("_brandes_chunk", kernel_atual, graph, sources, args.repeat)
+        diff = max((abs(a - b) for a, b in zip(old, new)), default=0.0)
+        print(f"  speedup: {t_old / t_new:.2f}x   pico: {peak_old / max(peak_new, 1):.2f}x menor"
+              f"   diferença máxima: {diff:.2e}")
+
+
+if __name__ == '__main__':
+    main()
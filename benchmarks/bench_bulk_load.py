@@ -0,0 +1,74 @@
+"""
+Benchmark da carga de arestas: add_edge + set_edge_weight por aresta
+(como o main.py fazia) contra from_weighted_dict / add_edges_from.
+
+Uso: python benchmarks/bench_bulk_load.py [--edges 1000000] [--vertices 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.AdjacencyListGraph import AdjacencyListGraph
+from src.AdjacencyMatrixGraph import AdjacencyMatrixGraph
+
+
+def gerar_dicionario(num_vertices, num_edges, seed):
+    """Gera {origem: {destino: peso}} com pesos inteiros como no grafo integrado."""
+    rng = random.Random(seed)
+    weighted_dict = {}
+    for _ in range(num_edges):
+        u = f"user{rng.randrange(num_vertices)}"
+        v = f"user{rng.randrange(num_vertices)}"
+        if u != v:
+            targets = weighted_dict.setdefault(u, {})
+            targets[v] = targets.get(v, 0) + rng.choice((2, 3, 4, 5))
+    return weighted_dict
+
+
+def carga_por_aresta(cls, weighted_dict):
+    graph = cls()
+    for origin, targets in weighted_dict.items():
+        u = graph.add_vertex_label(origin)
+        for target, weight in targets.items():
+            v = graph.add_vertex_label(target)
+            graph.add_edge(u, v)
+            graph.set_edge_weight(u, v, float(weight))
+    return graph
+
+
+def medir(nome, func, *args):
+    start = time.perf_counter()
+    graph = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"  {nome:<28} {elapsed:8.3f} s  ({graph.get_edge_count()} arestas)")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--edges', type=int, default=1_000_000)
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--matrix-vertices', type=int, default=2_000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"AdjacencyListGraph: {args.vertices} vértices, {args.edges} arestas sorteadas")
+    weighted_dict = gerar_dicionario(args.vertices, args.edges, args.seed)
+    t_loop = medir("add_edge + set_edge_weight", carga_por_aresta, AdjacencyListGraph, weighted_dict)
+    t_bulk = medir("from_weighted_dict", AdjacencyListGraph.from_weighted_dict, weighted_dict)
+    print(f"  speedup: {t_loop / t_bulk:.2f}x")
+
+    matrix_edges = min(args.edges, args.matrix_vertices * (args.matrix_vertices - 1) // 4)
+    print(f"AdjacencyMatrixGraph: {args.matrix_vertices} vértices, {matrix_edges} arestas sorteadas")
+    weighted_dict = gerar_dicionario(args.matrix_vertices, matrix_edges, args.seed)
+    t_loop = medir("add_edge + set_edge_weight", carga_por_aresta, AdjacencyMatrixGraph, weighted_dict)
+    t_bulk = medir("from_weighted_dict", AdjacencyMatrixGraph.from_weighted_dict, weighted_dict)
+    print(f"  speedup: {t_loop / t_bulk:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -389,39 +389,47 @@ print("--- Processamento de Pull Requests finalizado. ---")
 
 
 from src.AdjacencyListGraph import AdjacencyListGraph
+from src.BitsetMatrixGraph import BitsetMatrixGraph
 
-# 1. Identificar todos os usuários únicos para definir tamanho do grafo
-usuarios_unicos = set(grafo_integrado_ponderado.keys())
-for origem, destinos in grafo_integrado_ponderado.items():
-    usuarios_unicos.update(destinos.keys())
+# Instancia e povoa o Grafo (pode escolher Matriz ou Lista) direto do dicionário
+# {origem: {destino: peso}}: os rótulos viram IDs e as arestas entram em lote
+print("Criando grafo...")
+meu_grafo = AdjacencyListGraph.from_weighted_dict(grafo_integrado_ponderado)
 
-num_vertices = len(usuarios_unicos)
-print(f"Criando grafo com {num_vertices} vértices...")
+print(f"Grafo populado! Vértices: {meu_grafo.get_vertex_count()} | Arestas totais: {meu_grafo.get_edge_count()}")
 
-# 2. Instanciar o Grafo (pode escolher Matriz ou Lista)
-meu_grafo = AdjacencyListGraph(num_vertices)
+# A análise não altera mais o grafo: congela em CSR (arrays contíguos)
+meu_grafo = meu_grafo.freeze()
 
-# 3. Povoar o Grafo (Mapeando String -> Int)
-# Primeiro, registramos todos os usuários para gerar os IDs
-for usuario in usuarios_unicos:
-    meu_grafo.add_vertex_label(usuario)
-
-# Agora, criamos as arestas com os pesos
-for user_origem, conexoes in grafo_integrado_ponderado.items():
-    u_id = meu_grafo.label_to_id[user_origem]
-    
-    for user_destino, peso in conexoes.items():
-        v_id = meu_grafo.label_to_id[user_destino]
-        
-        meu_grafo.add_edge(u_id, v_id)
-        meu_grafo.set_edge_weight(u_id, v_id, float(peso))
-
-print(f"Grafo populado! Arestas totais: {meu_grafo.get_edge_count()}")
+# Snapshot binário do grafo: análises futuras podem reabri-lo com
+# CSRGraph.load(caminho, mmap=True) sem reprocessar os caches JSON
+meu_grafo.save(f"data/{repo_name}_grafo.bin")
 
 print("Exportando para Gephi...")
-meu_grafo.export_to_gephi("data/rede_dracula.gexf") 
+# Marca em cada aresta do grafo integrado de quais camadas (grafos 1, 2 e 3) ela faz parte
+def arestas_da_camada(grafo_camada):
+    ids = meu_grafo.label_to_id
+    return {(ids[origem], ids[destino])
+            for origem, destinos in grafo_camada.items() if origem in ids
+            for destino in destinos if destino in ids}
+
+camadas = {
+    "comentarios": arestas_da_camada(grafo_1_comentarios),
+    "fechamento_issue": arestas_da_camada(grafo_2_fechamento_issue),
+    "revisoes_e_merges": arestas_da_camada(grafo_3_revisoes_e_merges),
+}
+meu_grafo.export_to_gephi("data/rede_dracula.gexf", edge_attributes=camadas) 
 print("Arquivo 'rede_dracula.gexf' gerado com sucesso!")
 
+# As camadas só registram presença de interação: matriz de bits sem pesos
+grafos_camadas = {
+    nome: BitsetMatrixGraph.from_weighted_dict(
+        {origem: dict.fromkeys(destinos, 1) for origem, destinos in grafo_camada.items()})
+    for nome, grafo_camada in (("comentarios", grafo_1_comentarios),
+                               ("fechamento_issue", grafo_2_fechamento_issue),
+                               ("revisoes_e_merges", grafo_3_revisoes_e_merges))
+}
+
 
 #--- Analise do grafo --- (Etapa 3 do trabalho)
 
@@ -445,36 +453,49 @@ print("### A. MÉTRICAS GLOBAIS DE ESTRUTURA ###")
 density = meu_grafo.get_network_density()
 print(f"Densidade de Rede (Atividade): {density:.4f}")
 
-# 2. Coeficiente de Aglomeração Médio (Calculado em cada nó e depois a média)
-total_clustering = 0.0
-count = 0
-for i in range(N):
-    try:
-        total_clustering += meu_grafo.get_clustering_coefficient(i)
-        count += 1
-    except Exception:
-        pass
-
-avg_clustering = total_clustering / count if count > 0 else 0.0
-print(f"Coeficiente de Aglomeração Médio: {avg_clustering:.4f}")
-
-# 3. Assortatividade
-assortativity = meu_grafo.get_assortativity_coefficient()
+# 2. Coeficiente de Aglomeração Médio (todos os nós em uma única contagem de triângulos)
+aglomeracao = meu_grafo.get_clustering_coefficients()
+print(f"Coeficiente de Aglomeração Médio: {aglomeracao['average']:.4f}")
+print(f"Transitividade Global: {aglomeracao['transitivity']:.4f}")
+
+# 3. Assortatividade (as quatro variantes saem da mesma varredura de graus)
+estatisticas_grau = meu_grafo.get_degree_statistics()
+assortativity = estatisticas_grau['assortativity']['out-in']
 print(f"Coeficiente de Assortatividade (Out-In): {assortativity:.4f}")
+print("  Demais variantes: " + ", ".join(f"{variante}: {valor:.4f}"
+      for variante, valor in estatisticas_grau['assortativity'].items() if variante != 'out-in'))
 if assortativity > 0.05:
     print("  -> A rede é **Assortativa** (Contribuintes se conectam a Mergers/Reviewers experientes).")
 elif assortativity < -0.05:
     print("  -> A rede é **Dissortativa** (Contribuintes se conectam a menos experientes ou vice-versa).")
 else:
     print("  -> Neutra.")
+
+# 4. Camadas de interação (matriz de bits: conectividade por operações de conjunto)
+print("\nCamadas de Interação:")
+for nome, grafo_camada in grafos_camadas.items():
+    print(f"  {nome}: {grafo_camada.get_vertex_count()} nós, {grafo_camada.get_edge_count()} arestas, "
+          f"densidade {grafo_camada.get_network_density():.4f}, "
+          f"{grafo_camada.get_component_count()} componente(s)"
+          f"{' (conexa)' if grafo_camada.is_connected() else ''}")
 print("-" * 50)
 
 
 ## B. MÉTRICAS DE CENTRALIDADE (TOP USUÁRIOS)
 print("### B. TOP CONTRIBUIDORES POR CENTRALIDADE ###")
 
+# Número de origens sorteadas para a intermediação (None = cálculo exato).
+# Em repositórios muito grandes, um valor fixo (ex: 500) limita o tempo do relatório;
+# nesse caso a proximidade é calculada à parte, para todos os vértices.
+AMOSTRAS_INTERMEDIACAO = None
+intermediacao_exata = AMOSTRAS_INTERMEDIACAO is None
+
+# Intermediação de nós e de arestas e proximidade em uma única varredura de caminhos mínimos
+centralidades = meu_grafo.get_combined_centralities(normalize=False, closeness=intermediacao_exata,
+                                                    samples=AMOSTRAS_INTERMEDIACAO, seed=42)
+
 # 1. Intermediação (Betweenness)
-betweenness = meu_grafo.get_betweenness_centrality(normalize=False)
+betweenness = centralidades['betweenness']
 top_betweenness = sorted([(meu_grafo.get_label(k), v) for k, v in betweenness.items()], 
                          key=lambda item: item[1], reverse=True)[:5]
 print("\nTOP 5 - CENTRALIDADE DE INTERMEDIAÇÃO (HUB DE CONEXÕES):")
@@ -487,7 +508,10 @@ else:
         print(f"  {label} (Score: {score:.6f})")
 
 # 2. Proximidade (Closeness)
-closeness = {i: meu_grafo.get_closeness_centrality(i) for i in range(N)}
+if intermediacao_exata:
+    closeness = centralidades['closeness']
+else:
+    closeness = dict(enumerate(meu_grafo.closeness_centrality_all()))
 top_closeness = sorted([(meu_grafo.get_label(k), v) for k, v in closeness.items()], 
                        key=lambda item: item[1], reverse=True)[:5]
 
@@ -495,6 +519,33 @@ print("\nTOP 5 - CENTRALIDADE DE PROXIMIDADE (MAIS EFICIENTES):")
 for label, score in top_closeness:
     print(f"  {label} (Score: {score:.6f})")
 
+# Centralidade harmônica: inalcançáveis contam 0, adequada à rede desconexa
+harmonica = meu_grafo.closeness_centrality_all(harmonic=True)
+top_harmonica = sorted([(meu_grafo.get_label(k), v) for k, v in enumerate(harmonica)], 
+                       key=lambda item: item[1], reverse=True)[:5]
+
+print("\nTOP 5 - CENTRALIDADE HARMÔNICA:")
+for label, score in top_harmonica:
+    print(f"  {label} (Score: {score:.6f})")
+
+# 3. PageRank (influência ponderada; sumidouros redistribuem o score)
+pagerank = meu_grafo.get_pagerank()
+top_pagerank = sorted([(meu_grafo.get_label(k), v) for k, v in pagerank.items()], 
+                      key=lambda item: item[1], reverse=True)[:5]
+
+print("\nTOP 5 - PAGERANK (INFLUÊNCIA PONDERADA):")
+for label, score in top_pagerank:
+    print(f"  {label} (Score: {score:.6f})")
+
+print("-" * 50)
+
+
+## B2. NÚCLEO DA REDE (DECOMPOSIÇÃO K-CORE)
+nucleos = meu_grafo.get_core_numbers()
+k_max = max(nucleos, default=0)
+nucleo_central = meu_grafo.get_k_core(k_max)
+print(f"\nNÚCLEO CENTRAL ({k_max}-core, {len(nucleo_central)} usuários):")
+print(f"  {', '.join(meu_grafo.get_label(v) for v in nucleo_central[:10])}...")
 print("-" * 50)
 
 
@@ -503,10 +554,20 @@ print("### C. ANÁLISE DE COMUNIDADE ###")
 
 # 1. Laços Ponte (Bridging Ties)
 print("\nTOP 5 - LAÇOS PONTE (CONEXÕES CRÍTICAS ENTRE GRUPOS):")
-bridging_ties = meu_grafo.get_bridge_ties(top_n=5)
+bridging_ties = meu_grafo.get_bridge_ties(top_n=5, edge_betweenness=centralidades['edge_betweenness'])
 for u, v, score in bridging_ties:
     print(f"  {u} -> {v} (Intermediação de Aresta: {score:.4f})")
 
+# Pontes em sentido estrito e pontos únicos de falha (busca de Tarjan, O(V + E))
+pontes = meu_grafo.get_bridges()
+articulacoes = meu_grafo.get_articulation_points()
+print(f"\nPONTES (ARESTAS CUJA REMOÇÃO DESCONECTA A REDE): {len(pontes)}")
+for u, v in pontes[:5]:
+    print(f"  {u} -- {v}")
+print(f"PONTOS DE ARTICULAÇÃO (USUÁRIOS CRÍTICOS): {len(articulacoes)}")
+if articulacoes:
+    print(f"  {', '.join(articulacoes[:10])}...")
+
 # 2. Detecção de Comunidade Simplificada
 communities = meu_grafo.get_connected_components()
 
@@ -515,5 +576,21 @@ for i, comm in enumerate(communities):
     if len(comm) > 1: # Ignora grupos de um só membro (usuários isolados)
         print(f"  Comunidade {i+1} (Membros: {len(comm)}): {', '.join(comm[:5])}...")
 
+# 3. Detecção de Comunidades por Modularidade (Louvain com refinamento de Leiden)
+modularidade = meu_grafo.get_modularity_communities(refine=True, seed=42)
+
+print(f"\nDETECÇÃO DE COMUNIDADES (Modularidade Q = {modularidade['modularity']:.4f} - "
+      f"{len(modularidade['communities'])} Grupos):")
+for i, comm in enumerate(modularidade['communities'][:10]):
+    if len(comm) > 1:
+        print(f"  Comunidade {i+1} (Membros: {len(comm)}): {', '.join(comm[:5])}...")
+
+# 4. Componentes Fortemente Conexos (alcance mútuo seguindo a direção das interações)
+condensacao = meu_grafo.get_condensation()
+tamanhos = condensacao['sizes']
+arestas_dag = sum(len(sucessores) for sucessores in condensacao['successors'])
+print(f"\nCOMPONENTES FORTEMENTE CONEXOS: {len(tamanhos)} (maior: {max(tamanhos, default=0)} usuários)")
+print(f"  DAG de condensação: {len(tamanhos)} nós, {arestas_dag} arestas")
+
 print("\n" + "="*50)
 print("ANÁLISE COMPLETA CONCLUÍDA.")
\ No newline at end of file
@@ -1,33 +1,169 @@
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from functools import wraps
+from itertools import repeat
+from xml.sax.saxutils import quoteattr
+import gzip
+
+from src.UnionFind import UnionFind
+
+# --- Cache de métricas ---
+def cached_metric(maxsize=None, copy=True):
+    """
+    Memoiza um método de métrica por (nome, argumentos) enquanto o grafo não muda:
+    toda alteração incrementa graph.epoch, e a primeira consulta na nova época
+    descarta as entradas antigas.
+    - maxsize: limita as entradas do método, descartando a menos usada (LRU).
+    - copy: devolve cópias dos contêineres (dict, list, set, array), para que o
+      chamador possa alterá-los sem afetar o cache. Use copy=False apenas em
+      métodos internos cujo resultado é só lido.
+    Argumentos não hasheáveis (listas, dicionários, arrays) desativam o cache na chamada.
+    """
+    def decorator(method):
+        name = method.__name__
+
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            try:
+                hash(key)
+            except TypeError:
+                return method(self, *args, **kwargs)
+
+            if self._metric_cache_epoch != self.epoch:
+                self._metric_cache.clear()
+                self._metric_cache_epoch = self.epoch
+            entries = self._metric_cache.get(name)
+            if entries is None:
+                entries = self._metric_cache[name] = OrderedDict()
+
+            if key in entries:
+                entries.move_to_end(key)
+                result = entries[key]
+            else:
+                result = method(self, *args, **kwargs)
+                entries[key] = result
+                if maxsize is not None and len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return _copy_result(result) if copy else result
+        return wrapper
+    return decorator
+
+def _copy_result(value):
+    """Cópia dos contêineres de um resultado (os números e rótulos são imutáveis)."""
+    if isinstance(value, dict):
+        return {key: _copy_result(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_result(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_result(item) for item in value)
+    if isinstance(value, set):
+        return value.copy()
+    if isinstance(value, array):
+        return value[:]
+    return value
 
 class AbstractGraph(ABC):
     """
     Classe base abstrata. Define o contrato e atributos comuns.
     """
     
-    def __init__(self, num_vertices):
+    def __init__(self, num_vertices=0, track_components=False):
         # Este é o construtor que estava faltando!
+        # num_vertices é apenas o tamanho inicial: o grafo cresce sob demanda
         self.num_vertices = num_vertices
         self.vertex_weights = [0.0] * num_vertices
         self.labels = [None] * num_vertices  
         self.label_to_id = {}               
         self.count_vertices_used = 0
+        # Com track_components=True, um union-find das componentes fracas é mantido
+        # a cada inserção de aresta (None: precisa ser reconstruído, ver _component_index)
+        self.track_components = track_components
+        self._components = UnionFind(num_vertices) if track_components else None
+        # Época de alteração: incrementada a cada mudança que afeta as métricas,
+        # invalida os resultados memoizados por cached_metric
+        self.epoch = 0
+        self._metric_cache = {}
+        self._metric_cache_epoch = 0
+
+    def _bump_epoch(self):
+        self.epoch += 1
+
+    def __getstate__(self):
+        # O cache de métricas não segue para outros processos (ex: workers do pool)
+        state = self.__dict__.copy()
+        state['_metric_cache'] = {}
+        return state
 
     # --- Auxiliares para Mapeamento (String <-> Int) ---
     def add_vertex_label(self, label):
         """Associa um nome (ex: 'dracula') a um ID numérico."""
         if label not in self.label_to_id:
             if self.count_vertices_used >= self.num_vertices:
-                 # Se tentar adicionar mais do que o planejado
-                 raise ValueError(f"Capacidade do grafo excedida ({self.num_vertices}).")
+                 # Todos os vértices já têm rótulo: cria um novo vértice
+                 self.add_vertex()
             
             idx = self.count_vertices_used
             self.label_to_id[label] = idx
             self.labels[idx] = label
             self.count_vertices_used += 1
+            self._bump_epoch() # resultados com rótulos mudam
             return idx
         return self.label_to_id[label]
 
+    def add_vertex(self):
+        """
+        Acrescenta um vértice (sem rótulo) ao final e retorna seu ID.
+        As listas crescem com custo amortizado O(1).
+        """
+        idx = self.num_vertices
+        self._add_vertex_storage()
+        if self._components is not None:
+            self._components.add()
+        self.vertex_weights.append(0.0)
+        self.labels.append(None)
+        self.num_vertices += 1
+        self._bump_epoch()
+        return idx
+
+    def _reserve_for(self, weighted_dict):
+        """
+        Gancho chamado por from_weighted_dict antes da inserção. Nas listas não há o
+        que reservar; a matriz sobrescreve para alocar a largura final de uma vez.
+        """
+
+    def add_vertex_labels(self, labels):
+        """
+        Registra vários rótulos de uma vez e retorna a lista de IDs, na mesma ordem.
+        Rótulos já conhecidos custam uma única consulta ao dicionário.
+        """
+        lookup = self.label_to_id.get
+        ids = []
+        for label in labels:
+            idx = lookup(label)
+            if idx is None:
+                idx = self.add_vertex_label(label)
+            ids.append(idx)
+        return ids
+
+    @classmethod
+    def from_weighted_dict(cls, weighted_dict, *args, **kwargs):
+        """
+        Constrói o grafo a partir de um dicionário {origem: {destino: peso}},
+        no formato de 'grafo_integrado_ponderado' do main.py, em uma única
+        passada: cada linha tem seus rótulos registrados em lote e suas
+        arestas inseridas com add_edges_from.
+        Argumentos extras são repassados ao construtor da classe.
+        """
+        graph = cls(*args, **kwargs)
+        graph._reserve_for(weighted_dict)
+        for origin, targets in weighted_dict.items():
+            u = graph.add_vertex_label(origin)
+            target_ids = graph.add_vertex_labels(targets)
+            graph.add_edges_from(zip(repeat(u), target_ids, targets.values()))
+        return graph
+
     def get_label(self, v):
         if 0 <= v < len(self.labels):
             return self.labels[v]
@@ -48,40 +184,204 @@ class AbstractGraph(ABC):
     def get_vertex_weight(self, v):
         self.validate_index(v)
         return self.vertex_weights[v]
-        
-    # --- Exportação para GEPHI ---
-    def export_to_gephi(self, path):
-        # Gera XML simples para abrir no Gephi
-        xml = ['<?xml version="1.0" encoding="UTF-8"?>']
-        xml.append('<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">')
-        xml.append('  <graph mode="static" defaultedgetype="directed">')
-        xml.append('    <nodes>')
-        for i in range(self.num_vertices):
-            lbl = self.labels[i] if self.labels[i] else str(i)
-            xml.append(f'      <node id="{i}" label="{lbl}" />')
-        xml.append('    </nodes>')
-        xml.append('    <edges>')
-        eid = 0
+
+    # --- Iteração sobre vértices e arestas ---
+    # Os backends implementam out_edges / in_edges (pares (vizinho, peso)) e
+    # successors / predecessors (apenas os IDs) sem montar listas intermediárias;
+    # os iteradores abaixo são construídos sobre eles.
+
+    def edges(self):
+        """Itera todas as arestas como tuplas (u, v, peso), origem a origem."""
         for u in range(self.num_vertices):
-            for v in range(self.num_vertices):
-                if self.has_edge(u, v):
-                    w = self.get_edge_weight(u, v)
-                    xml.append(f'      <edge id="{eid}" source="{u}" target="{v}" weight="{w}" />')
-                    eid += 1
-        xml.append('    </edges>')
-        xml.append('  </graph>')
-        xml.append('</gexf>')
+            for v, w in self.out_edges(u):
+                yield u, v, w
+
+    def vertices(self):
+        """Itera os vértices como pares (ID, rótulo); o rótulo é None se não houver."""
+        return zip(range(self.num_vertices), self.labels)
+
+    # --- Conectividade fraca incremental (union-find) ---
+    def _component_index(self):
+        """
+        Union-find das componentes fracamente conexas. Com track_components=True ele
+        acompanha cada inserção de aresta e só é reconstruído (uma passada O(V + E))
+        na primeira consulta após uma remoção; sem rastreamento, é montado a cada chamada.
+        """
+        if self._components is not None:
+            return self._components
+        components = UnionFind(self.num_vertices)
+        for u in range(self.num_vertices):
+            for v in self.successors(u):
+                components.union(u, v)
+        if self.track_components:
+            self._components = components
+        return components
+
+    def _invalidate_components(self):
+        # Uma remoção pode dividir uma componente, o que o union-find não desfaz
+        self._components = None
+
+    def get_component_count(self):
+        """Número de componentes fracamente conexas (ignorando a direção das arestas)."""
+        return self._component_index().count
+
+    def same_component(self, u, v):
+        """Verifica se u e v estão na mesma componente fracamente conexa."""
+        self.validate_index(u)
+        self.validate_index(v)
+        return self._component_index().connected(u, v)
+
+    def freeze(self):
+        """
+        Gera um snapshot imutável do grafo em formato CSR (Compressed Sparse Row),
+        com as mesmas consultas e métricas de leitura. Indicado para a etapa de
+        análise, que não altera mais o grafo.
+        """
+        from src.CSRGraph import CSRGraph # import local evita import circular
+        return CSRGraph(self)
+
+    def save(self, path):
+        """Grava um snapshot binário do grafo (ver CSRGraph.save)."""
+        self.freeze().save(path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Reconstrói um grafo desta classe a partir de um snapshot gravado com save().
+        Para apenas analisar, CSRGraph.load(path, mmap=True) evita a reconstrução.
+        """
+        from src.CSRGraph import CSRGraph # import local evita import circular
+        snapshot = CSRGraph.load(path)
+        graph = cls(snapshot.num_vertices)
+        graph.vertex_weights = list(snapshot.vertex_weights)
+        graph.labels = snapshot.labels
+        graph.label_to_id = snapshot.label_to_id
+        graph.count_vertices_used = snapshot.count_vertices_used
+        graph.add_edges_from(snapshot.edges())
+        return graph
         
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write("\n".join(xml))
+    # --- Exportação para GEPHI ---
+    def export_to_gephi(self, path, compress=None, include_vertex_weights=False, edge_attributes=None):
+        """
+        Gera o XML (GEXF) para abrir no Gephi, escrevendo em streaming no arquivo:
+        percorre apenas as arestas existentes, em O(V + E).
+        - compress: grava com gzip; por padrão, quando 'path' termina em '.gz'.
+        - include_vertex_weights: adiciona o atributo 'weight' em cada nó.
+        - edge_attributes: {nome: valores} com atributos extras das arestas, onde
+          'valores' é um dicionário {(u, v): valor} ou um conjunto de pares (u, v)
+          (atributo booleano, ex: as arestas de uma camada de interação).
+        """
+        if compress is None:
+            compress = str(path).endswith('.gz')
+        edge_attributes = edge_attributes or {}
+
+        # Declaração dos atributos de aresta: (id, valores, tipo)
+        edge_columns = []
+        for att_id, (title, values) in enumerate(edge_attributes.items()):
+            if isinstance(values, dict):
+                sample = next(iter(values.values()), '')
+                att_type = self._gexf_type(sample)
+            else:
+                att_type = 'boolean'
+            edge_columns.append((att_id, title, values, att_type))
+
+        opener = gzip.open if compress else open
+        with opener(path, 'wt', encoding='utf-8') as f:
+            f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            f.write('<gexf xmlns="http://www.gexf.net/1.2draft" version="1.2">\n')
+            f.write('  <graph mode="static" defaultedgetype="directed">\n')
+
+            if include_vertex_weights:
+                f.write('    <attributes class="node">\n')
+                f.write('      <attribute id="weight" title="weight" type="double" />\n')
+                f.write('    </attributes>\n')
+            if edge_columns:
+                f.write('    <attributes class="edge">\n')
+                for att_id, title, _, att_type in edge_columns:
+                    if att_type == 'boolean':
+                        f.write(f'      <attribute id="{att_id}" title={quoteattr(str(title))} type="boolean">'
+                                f'<default>false</default></attribute>\n')
+                    else:
+                        f.write(f'      <attribute id="{att_id}" title={quoteattr(str(title))} type="{att_type}" />\n')
+                f.write('    </attributes>\n')
+
+            f.write('    <nodes>\n')
+            for i in range(self.num_vertices):
+                lbl = self.labels[i] if self.labels[i] else str(i)
+                if include_vertex_weights:
+                    f.write(f'      <node id="{i}" label={quoteattr(str(lbl))}><attvalues>'
+                            f'<attvalue for="weight" value="{self.vertex_weights[i]}" /></attvalues></node>\n')
+                else:
+                    f.write(f'      <node id="{i}" label={quoteattr(str(lbl))} />\n')
+            f.write('    </nodes>\n')
+
+            f.write('    <edges>\n')
+            eid = 0
+            for u, v, w in self.edges():
+                attvalues = self._gexf_edge_attvalues(edge_columns, u, v)
+                if attvalues:
+                    f.write(f'      <edge id="{eid}" source="{u}" target="{v}" weight="{w}">'
+                            f'<attvalues>{attvalues}</attvalues></edge>\n')
+                else:
+                    f.write(f'      <edge id="{eid}" source="{u}" target="{v}" weight="{w}" />\n')
+                eid += 1
+            f.write('    </edges>\n')
+            f.write('  </graph>\n')
+            f.write('</gexf>')
         print(f"Exportado para {path}")
 
+    @staticmethod
+    def _gexf_type(value):
+        """Tipo GEXF correspondente a um valor Python."""
+        if isinstance(value, bool):
+            return 'boolean'
+        if isinstance(value, int):
+            return 'integer'
+        if isinstance(value, float):
+            return 'double'
+        return 'string'
+
+    @staticmethod
+    def _gexf_edge_attvalues(edge_columns, u, v):
+        """Trecho <attvalue .../> da aresta (u, v); omite valores ausentes (padrão)."""
+        parts = []
+        for att_id, _, values, att_type in edge_columns:
+            if att_type == 'boolean' and not isinstance(values, dict):
+                if (u, v) in values:
+                    parts.append(f'<attvalue for="{att_id}" value="true" />')
+                continue
+            value = values.get((u, v))
+            if value is None:
+                continue
+            if isinstance(value, bool):
+                value = 'true' if value else 'false'
+            parts.append(f'<attvalue for="{att_id}" value={quoteattr(str(value))} />')
+        return ''.join(parts)
+
     # --- Métodos Abstratos (Obrigatórios para as filhas) ---
     @abstractmethod
     def has_edge(self, u, v): pass
+
+    @abstractmethod
+    def _add_vertex_storage(self): pass
+
+    @abstractmethod
+    def out_edges(self, u): pass
+
+    @abstractmethod
+    def in_edges(self, v): pass
+
+    @abstractmethod
+    def successors(self, u): pass
+
+    @abstractmethod
+    def predecessors(self, v): pass
     
     @abstractmethod
     def add_edge(self, u, v): pass
+
+    @abstractmethod
+    def add_edges_from(self, edges): pass
     
     @abstractmethod
     def remove_edge(self, u, v): pass
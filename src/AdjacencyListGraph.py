@@ -1,19 +1,65 @@
-from src.AbstractGraph import AbstractGraph
+from src.AbstractGraph import AbstractGraph, cached_metric, _copy_result
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+from operator import mul
 import heapq
 import math 
+import random
+
+# --- Execução paralela ---
+# Cada processo do pool recebe o grafo uma única vez (initializer) e depois
+# apenas executa métodos sobre blocos de vértices.
+_worker_graph = None
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+def _run_on_worker(method_name, *args):
+    return getattr(_worker_graph, method_name)(*args)
+
+# Maior peso inteiro atendido pela fila de baldes (Dial) nos caminhos mínimos
+MAX_BUCKET_WEIGHT = 64
+
+# Quantidade de árvores de caminhos mínimos (uma por origem) mantidas no cache de dijkstra()
+SSSP_CACHE_SIZE = 32
+
+def _weight_class(w):
+    """0: peso unitário; 1: inteiro em [2, MAX_BUCKET_WEIGHT]; 2: qualquer outro."""
+    if w == 1.0:
+        return 0
+    if 1.0 <= w <= MAX_BUCKET_WEIGHT and w == int(w):
+        return 1
+    return 2
 
 class AdjacencyListGraph(AbstractGraph):
     """
     Implementação utilizando Lista de Adjacência.
     Estrutura: Uma lista onde cada posição 'u' contém um dicionário
     {v: peso, v2: peso2}
+    Mantém também o índice reverso 'pred_list', onde cada posição 'v'
+    contém {u: peso} para as arestas u -> v (predecessores de v).
     """
 
 
-    def __init__(self, num_vertices): # [cite: 50]
-        super().__init__(num_vertices)
+    def __init__(self, num_vertices=0, track_components=False): # [cite: 50]
+        super().__init__(num_vertices, track_components)
         self.adj_list = [{} for _ in range(num_vertices)]
+        # Índice reverso mantido em sincronia com adj_list: len(pred_list[v])
+        # é o grau de entrada e len(adj_list[u]) o grau de saída, ambos O(1)
+        self.pred_list = [{} for _ in range(num_vertices)]
         self.num_edges = 0
+        # Quantidade de arestas em cada classe de peso (ver _weight_class),
+        # usada para escolher BFS / Dial / Dijkstra em O(1)
+        self.weight_class_count = [0, 0, 0]
+        # Último vetor do PageRank, ponto de partida do modo incremental
+        self._last_pagerank = None
+
+    def _add_vertex_storage(self):
+        self.adj_list.append({})
+        self.pred_list.append({})
 
     def get_edge_count(self):
         return self.num_edges
@@ -31,22 +77,93 @@ class AdjacencyListGraph(AbstractGraph):
         
         if v not in self.adj_list[u]:
             self.adj_list[u][v] = 1.0 # Peso padrão
+            self.pred_list[v][u] = 1.0
             self.num_edges += 1
+            self.weight_class_count[0] += 1
+            if self._components is not None:
+                self._components.union(u, v)
+            self._bump_epoch()
+
+    def add_edges_from(self, edges):
+        """
+        Inserção em lote de arestas (u, v) ou (u, v, peso).
+        Equivale a add_edge seguido de set_edge_weight para cada item, mas
+        valida os índices inline e escreve direto nos dicionários.
+        Sem peso, uma aresta nova recebe 1.0 e uma existente mantém o seu.
+        """
+        n = self.num_vertices
+        adj_list, pred_list = self.adj_list, self.pred_list
+        weight_class_count = self.weight_class_count
+        components = self._components
+        added = 0
+        try:
+            for edge in edges:
+                u, v = edge[0], edge[1]
+                if not (0 <= u < n and 0 <= v < n):
+                    raise ValueError(f"Índice de vértice inválido: {u if not 0 <= u < n else v}")
+                if u == v: continue # Sem laços
+
+                successors = adj_list[u]
+                if v not in successors:
+                    added += 1
+                    if components is not None:
+                        components.union(u, v)
+                elif len(edge) < 3:
+                    continue
+                else:
+                    weight_class_count[_weight_class(successors[v])] -= 1
+                w = float(edge[2]) if len(edge) > 2 else 1.0 # Peso padrão
+                weight_class_count[_weight_class(w)] += 1
+                successors[v] = w
+                pred_list[v][u] = w
+        finally:
+            # Mantém a contagem correta mesmo se um índice inválido interromper o lote
+            self.num_edges += added
+            self._bump_epoch()
 
     def remove_edge(self, u, v):
         if self.has_edge(u, v):
+            self.weight_class_count[_weight_class(self.adj_list[u][v])] -= 1
             del self.adj_list[u][v]
+            del self.pred_list[v][u]
             self.num_edges -= 1
+            self._invalidate_components()
+            self._bump_epoch()
 
     def set_edge_weight(self, u, v, w):
         if self.has_edge(u, v):
+            self.weight_class_count[_weight_class(self.adj_list[u][v])] -= 1
+            self.weight_class_count[_weight_class(float(w))] += 1
             self.adj_list[u][v] = float(w)
+            self.pred_list[v][u] = float(w)
+            self._bump_epoch()
 
     def get_edge_weight(self, u, v):
         if self.has_edge(u, v):
             return self.adj_list[u][v]
         return 0.0
 
+    # --- Acesso às arestas de um vértice ---
+    # Os algoritmos abaixo percorrem o grafo apenas por estes métodos (e pelos
+    # iteradores edges() / vertices() de AbstractGraph), o que permite
+    # reutilizá-los sobre outras representações (ex: CSRGraph).
+
+    def out_edges(self, u):
+        """Pares (v, peso) das arestas u -> v."""
+        return self.adj_list[u].items()
+
+    def in_edges(self, v):
+        """Pares (u, peso) das arestas u -> v."""
+        return self.pred_list[v].items()
+
+    def successors(self, u):
+        """IDs v das arestas u -> v."""
+        return iter(self.adj_list[u])
+
+    def predecessors(self, v):
+        """IDs u das arestas u -> v."""
+        return iter(self.pred_list[v])
+
     # --- Lógica de Grafos ---
 
     def is_successor(self, u, v):
@@ -72,11 +189,7 @@ class AdjacencyListGraph(AbstractGraph):
 
     def get_vertex_in_degree(self, u):
         self.validate_index(u)
-        in_degree = 0
-        for i in range(self.num_vertices):
-            if u in self.adj_list[i]:
-                in_degree += 1
-        return in_degree
+        return len(self.pred_list[u])
 
     def get_vertex_out_degree(self, u):
         self.validate_index(u)
@@ -91,32 +204,30 @@ class AdjacencyListGraph(AbstractGraph):
 
     def is_connected(self):
         if self.num_vertices == 0: return True
+        if self.track_components:
+            return self._component_index().count == 1
         
-        # Cria uma versão "não direcionada" temporária apenas para checagem
-        # Ou verifica conectividade fraca via BFS
-        visited = [False] * self.num_vertices
-        queue = [0]
-        visited[0] = True
-        count_visited = 0
-        
+        # Verifica conectividade fraca via BFS, O(V + E)
+        return len(self._weak_component_bfs(0, [False] * self.num_vertices)) == self.num_vertices
+
+    def _weak_component_bfs(self, start, visited):
+        """
+        BFS ignorando a direção das arestas: percorre sucessores (successors)
+        e predecessores (predecessors). Marca 'visited' e retorna os IDs alcançados.
+        """
+        visited[start] = True
+        queue = deque([start])
+        component_ids = [start]
+
         while queue:
-            u = queue.pop(0)
-            count_visited += 1
-            
-            # Vizinhos diretos (saída)
-            neighbors = list(self.adj_list[u].keys())
-            
-            # Vizinhos inversos (entrada) - custoso em lista de adjacência, mas necessário para "weakly connected"
-            for i in range(self.num_vertices):
-                if u in self.adj_list[i]:
-                    neighbors.append(i)
-            
-            for v in neighbors:
+            u = queue.popleft()
+            for v in chain(self.successors(u), self.predecessors(u)):
                 if not visited[v]:
                     visited[v] = True
                     queue.append(v)
-                    
-        return count_visited == self.num_vertices
+                    component_ids.append(v)
+
+        return component_ids
         
     # --- Métricas de Grafos --- Analise do repositorio (Etapa 3)
 
@@ -131,12 +242,18 @@ class AdjacencyListGraph(AbstractGraph):
             return 0.0
         return degree / (self.num_vertices - 1)
     
+    @cached_metric(maxsize=SSSP_CACHE_SIZE)
     def dijkstra(self, start):
         """
         Implementa o algoritmo de Dijkstra para encontrar o caminho mais curto
         a partir do vértice 'start' para todos os outros vértices no grafo.
         Retorna um dicionário com as distâncias mínimas.
+        As últimas SSSP_CACHE_SIZE origens consultadas ficam em cache até a próxima alteração.
         """
+        return self._dijkstra_paths(start)
+
+    def _dijkstra_paths(self, start):
+        """Dijkstra com heap, sem cache: usado pelas varreduras sobre todas as origens."""
         self.validate_index(start)
         distances = {v: float('inf') for v in range(self.num_vertices)}
         distances[start] = 0.0
@@ -154,7 +271,7 @@ class AdjacencyListGraph(AbstractGraph):
             if current_distance > distances[u]:
                 continue
 
-            for v, weight in self.adj_list[u].items():
+            for v, weight in self.out_edges(u):
                 distance = current_distance + weight
 
                 if distance < distances[v]:
@@ -167,147 +284,649 @@ class AdjacencyListGraph(AbstractGraph):
                     shortest_path_count[v] += shortest_path_count[u] # incrementa contagem de caminhos mais curtos
 
         return distances, predecessors, shortest_path_count
-    
+
+    def _weight_profile(self):
+        """
+        Classifica os pesos do grafo: 'unit' (todos 1.0), 'int' (inteiros entre 1 e
+        MAX_BUCKET_WEIGHT) ou 'float' (qualquer outro caso).
+        """
+        if self.weight_class_count[2]:
+            return 'float'
+        if self.weight_class_count[1]:
+            return 'int'
+        return 'unit'
+
+    @cached_metric()
     def get_closeness_centrality(self, u):
         """
         Calcula a centralidade de proximidade do vértice u
         """
         self.validate_index(u)
-        distances, _, _ = self.dijkstra(u)
-        sum_distances = 0.0
+        return self._closeness_chunk([u])[0]
+
+    def _closeness_from_distances(self, u, distances, reached, harmonic=False):
+        """
+        Proximidade (ou centralidade harmônica) de u a partir das distâncias com origem em u.
+        'reached' traz os vértices alcançados na ordem da busca: a soma não é reordenada,
+        então com pesos reais o resultado pode variar na última casa decimal conforme a ordem.
+        """
+        total = 0.0
         reachable_vertices = 0 # Vértices alcançáveis a partir de u excluindo ele mesmo
-        for v in range(self.num_vertices):
+        for v in reached:
             if v != u:
-                tempdistances=distances[v]
-                
-                # Considera apenas vértices alcançáveis
-                if tempdistances != float('inf'):
-                    sum_distances += tempdistances
+                d = distances[v]
+                if harmonic:
+                    if d > 0:
+                        total += 1.0 / d
+                else:
+                    total += d
                     reachable_vertices += 1
 
-        if sum_distances == 0.0 or reachable_vertices == 0:
+        if harmonic:
+            return total / (self.num_vertices - 1) if self.num_vertices > 1 else 0.0
+        if total == 0.0 or reachable_vertices == 0:
             return 0.0
-        
         # Normaliza pela quantidade de vértices alcançáveis
-        return reachable_vertices / sum_distances
-    
-    def get_betweenness_centrality(self, normalize=True):
+        return reachable_vertices / total
+
+    @cached_metric()
+    def closeness_centrality_all(self, harmonic=False, workers=None, chunk_size=None):
+        """
+        Proximidade de todos os vértices, com um caminho mínimo só de distâncias por
+        origem (sem predecessores nem contagens) e buffers reutilizados entre origens.
+        Com harmonic=False, mesmo valor de get_closeness_centrality para cada vértice.
+        Com harmonic=True, calcula a centralidade harmônica: soma de 1 / d(u, v) sobre
+        os vértices alcançáveis, dividida por N - 1. Vértices inalcançáveis contribuem 0,
+        o que a torna comparável entre componentes de um grafo desconexo.
+        Com workers > 1, os blocos de origens (ver _source_chunks) rodam em processos.
+
+        Retorna: array de floats indexado pelo ID do vértice.
+        """
+        chunks = self._source_chunks(range(self.num_vertices), chunk_size)
+        result = array('d')
+        if workers is None or workers <= 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                result.extend(self._closeness_chunk(chunk, harmonic))
+            return result
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            for partial in executor.map(_run_on_worker, repeat('_closeness_chunk'), chunks, repeat(harmonic)):
+                result.extend(partial)
+        return result
+
+    def _closeness_chunk(self, sources, harmonic=False):
+        """Proximidade (ou centralidade harmônica) de cada origem do bloco, em ordem."""
+        distances = [math.inf] * self.num_vertices
+        touched = []
+        scores = array('d')
+
+        for s in sources:
+            self._distances_from(s, distances, touched)
+            scores.append(self._closeness_from_distances(s, distances, touched, harmonic))
+
+            # Restaura apenas as posições alcançadas para a próxima origem
+            for v in touched:
+                distances[v] = math.inf
+            touched.clear()
+
+        return scores
+
+    def _distances_from(self, start, distances, touched):
+        """
+        Distâncias mínimas a partir de 'start' (BFS, Dial ou Dijkstra, conforme os pesos).
+        Escreve em 'distances', que deve chegar com math.inf em todas as posições, e
+        acrescenta a 'touched' cada vértice alcançado, para que o chamador restaure o buffer.
+        """
+        profile = self._weight_profile()
+        distances[start] = 0
+        touched.append(start)
+
+        if profile == 'unit':
+            # A própria lista 'touched' serve de fila da BFS
+            head = 0
+            while head < len(touched):
+                u = touched[head]
+                head += 1
+                next_distance = distances[u] + 1
+                for v in self.successors(u):
+                    if distances[v] == math.inf:
+                        distances[v] = next_distance
+                        touched.append(v)
+            return
+
+        if profile == 'int':
+            ring_size = MAX_BUCKET_WEIGHT + 1
+            buckets = [[] for _ in range(ring_size)]
+            buckets[0].append(start)
+            pending = 1
+            current_distance = 0
+            while pending:
+                bucket = buckets[current_distance % ring_size]
+                while not bucket:
+                    current_distance += 1
+                    bucket = buckets[current_distance % ring_size]
+                u = bucket.pop()
+                pending -= 1
+                if distances[u] != current_distance:
+                    continue # entrada obsoleta
+                for v, weight in self.out_edges(u):
+                    distance = current_distance + int(weight)
+                    if distance < distances[v]:
+                        if distances[v] == math.inf:
+                            touched.append(v)
+                        distances[v] = distance
+                        buckets[distance % ring_size].append(v)
+                        pending += 1
+            return
+
+        distances[start] = 0.0
+        priority_queue = [(0.0, start)]
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            if current_distance > distances[u]:
+                continue
+            for v, weight in self.out_edges(u):
+                distance = current_distance + weight
+                if distance < distances[v]:
+                    if distances[v] == math.inf:
+                        touched.append(v)
+                    distances[v] = distance
+                    heapq.heappush(priority_queue, (distance, v))
+
+    @cached_metric()
+    def get_betweenness_centrality(self, normalize=True, workers=None, chunk_size=None,
+                                   samples=None, epsilon=None, delta=0.1, seed=None):
         """
         Calcula a Centralidade de Intermediação (Betweenness Centrality) para todos os nós
         usando o Algoritmo de Brandes (baseado no Dijkstra).
+        Com workers > 1, as origens são divididas entre processos (ver _brandes_sweep);
+        o resultado é idêntico ao da execução serial.
+        Com 'samples' ou 'epsilon' o cálculo é aproximado por amostragem de origens
+        (ver _sample_sources), com custo proporcional ao número de amostras.
         
         Retorna: Um dicionário {node: betweenness_score}.
         """
         num_nodes = self.num_vertices
-        # Inicializa o score de intermediação de todos os nós com 0.0
-        betweenness = {node: 0.0 for node in range(num_nodes)}
-    
-        # Itera sobre cada nó 's' como a origem (source)
-        for s in range(num_nodes):
-        # Roda Dijkstra a partir de 's'.
-        # O terceiro retorno (shortest_path_count) é crucial aqui.
-            distances, predecessors, shortest_path_count = self.dijkstra(s)
-        
-            # Pilha (Stack): Armazena os nós na ordem decrescente de distância de 's'
-            stack = []
-            # Dependência (delta): Usada para calcular o quanto um nó depende de seus predecessores
-            dependency = {node: 0.0 for node in range(num_nodes)}
-            
-            # Preenche a pilha com os nós alcançáveis
-            # Filtra os nós pela distância finita
-            sorted_nodes = [node for node in range(num_nodes) if distances[node] != float('inf')]
-            
-            # Ordena os nós por distância para processar de trás para frente (folhas -> raiz)
-            sorted_nodes.sort(key=lambda node: distances[node], reverse=True)
-            
-            for v in sorted_nodes:
-                if v != s:
-                    stack.append(v)
-            
-            # 2. Fase de Acumulação
-            while stack:
-                w = stack.pop()
-
-                # Para cada predecessor 'v' de 'w' no caminho mais curto
-                for v in predecessors[w]:
-                    
-                    # Proporção de caminhos mais curtos de s->w que passam por v
-                    if shortest_path_count[w] > 0 and shortest_path_count[v] > 0:
-                        fraction = shortest_path_count[v] / shortest_path_count[w]
-                    else:
-                        fraction = 0.0  
-                    # Acumula a dependência: delta_w = (shortest_path_count[v] / shortest_path_count[w]) * (1 + delta_w)
-                    dependency[v] += fraction * (1.0 + dependency[w])
-                # Adiciona a dependência ao score de Betweenness de 'w'
-                # (Exclui a Centralidade de Intermediação do nó de partida 's')
-                if w != s:
-                    betweenness[w] += dependency[w]
+        sources, scale = self._sample_sources(samples, epsilon, delta, seed, num_nodes)
+        node_scores, _, _ = self._brandes_sweep(sources, node=True, edge=False,
+                                                workers=workers, chunk_size=chunk_size)
+        betweenness = {node: node_scores[node] * scale for node in range(num_nodes)}
                     
         # 3. Normalização
         if normalize:
-            N = num_nodes
-            
-            # Fator de normalização para grafos dirigidos: (N-1) * (N-2)
-            # O fator para grafos dirigidos é: (N-1) * (N-2)
-            # Se for não-dirigido, seria: (N-1) * (N-2) / 2
-            
-            # Fator máximo (Max possible score)
-            max_score = (N - 1) * (N - 2) 
-
-            if max_score > 0:
-                for node in betweenness:
-                    # Divide pelo score máximo para obter um valor entre 0 e 1
-                    betweenness[node] = betweenness[node] / max_score
+            self._normalize_betweenness(betweenness)
         return betweenness        
 
-    def eigenvector_centrality(self, max_iterations=100, tolerance=1.0e-6):
+    def _normalize_betweenness(self, betweenness):
+        """Divide os scores de nós pelo máximo possível em grafos dirigidos."""
+        N = self.num_vertices
+
+        # Fator de normalização para grafos dirigidos: (N-1) * (N-2)
+        # Se for não-dirigido, seria: (N-1) * (N-2) / 2
+        max_score = (N - 1) * (N - 2) # Fator máximo (Max possible score)
+
+        if max_score > 0:
+            for node in betweenness:
+                # Divide pelo score máximo para obter um valor entre 0 e 1
+                betweenness[node] = betweenness[node] / max_score
+
+    @cached_metric()
+    def get_combined_centralities(self, normalize=True, closeness=True, workers=None, chunk_size=None,
+                                  samples=None, epsilon=None, delta=0.1, seed=None):
+        """
+        Calcula em uma única varredura de caminhos mínimos (um Dijkstra por origem)
+        a intermediação de nós, a intermediação de arestas e, opcionalmente, a
+        proximidade de todos os nós. Equivale a chamar get_betweenness_centrality,
+        get_edge_betweenness_centrality e get_closeness_centrality para cada nó,
+        pela metade (ou um terço) do custo.
+        Aceita a mesma amostragem de origens de get_betweenness_centrality; nesse
+        caso 'closeness' traz apenas as origens amostradas.
+
+        Retorna: {'betweenness': {node: score}, 'edge_betweenness': {(u, v): score},
+                  'closeness': {node: score} (apenas se closeness=True)}.
+        """
+        num_nodes = self.num_vertices
+        sources, scale = self._sample_sources(samples, epsilon, delta, seed,
+                                              num_nodes + self.get_edge_count())
+        node_scores, edge_scores, closeness_scores = self._brandes_sweep(
+            sources, node=True, edge=True, closeness=closeness,
+            workers=workers, chunk_size=chunk_size)
+
+        betweenness = {node: node_scores[node] * scale for node in range(num_nodes)}
+        if normalize:
+            self._normalize_betweenness(betweenness)
+
+        edge_betweenness = {}
+        for u in range(num_nodes):
+            for v in self.successors(u):
+                edge_betweenness[(u, v)] = edge_scores.get((u, v), 0.0) * scale
+
+        result = {'betweenness': betweenness, 'edge_betweenness': edge_betweenness}
+        if closeness:
+            result['closeness'] = {node: closeness_scores[node] for node in sources}
+        return result
+
+    def _sample_sources(self, samples=None, epsilon=None, delta=0.1, seed=None, num_items=1):
+        """
+        Escolhe as origens do Algoritmo de Brandes e o fator de escala das somas.
+        Sem 'samples' nem 'epsilon': todas as origens, escala 1 (cálculo exato).
+        Com 'samples': sorteia esse número de origens distintas (reprodutível via 'seed')
+        e escala por N / samples, um estimador não enviesado.
+        Com 'epsilon': usa k = ceil(ln(2 * num_items / delta) / (2 * epsilon^2)) amostras
+        (desigualdade de Hoeffding + união sobre os 'num_items' scores), garantindo, com
+        probabilidade >= 1 - delta, erro absoluto <= epsilon em todos os scores na escala
+        normalizada (nós: (N-1)(N-2); arestas: N(N-1)).
+        """
+        n = self.num_vertices
+        if samples is None and epsilon is None:
+            return range(n), 1.0
+
+        if samples is None:
+            if epsilon <= 0 or not 0 < delta < 1:
+                raise ValueError("epsilon deve ser > 0 e delta deve estar em (0, 1).")
+            # Cada origem contribui no máximo N / (N - 1) na escala normalizada
+            spread = n / (n - 1) if n > 1 else 1.0
+            samples = math.ceil(spread * spread * math.log(2 * max(num_items, 1) / delta) / (2 * epsilon ** 2))
+        if samples < 1:
+            raise ValueError(f"Número de amostras inválido: {samples}")
+        if samples >= n:
+            return range(n), 1.0
+
+        sources = sorted(random.Random(seed).sample(range(n), samples))
+        return sources, n / samples
+
+    def _brandes_sweep(self, sources, node=True, edge=False, closeness=False, workers=None, chunk_size=None):
+        """
+        Executa o Algoritmo de Brandes a partir de cada origem em 'sources' e soma as
+        dependências de nós (node) e/ou de arestas (edge). Com closeness=True, também
+        calcula a proximidade de cada origem com as mesmas distâncias.
+        As origens são agrupadas em blocos de 'chunk_size' (por padrão, no máximo 64
+        blocos); cada bloco gera somas parciais que são reduzidas na ordem dos blocos.
+        Com workers > 1 os blocos rodam em um ProcessPoolExecutor que recebe o grafo
+        uma única vez por processo. Como o agrupamento não depende de 'workers', os
+        resultados serial e paralelo são idênticos.
+
+        Retorna: (lista de scores por nó ou None, dicionário {(u, v): score} ou None,
+                  dicionário {origem: proximidade} ou None).
+        """
+        chunks = self._source_chunks(sources, chunk_size)
+        if workers is None or workers <= 1 or len(chunks) <= 1:
+            partials = (self._brandes_chunk(chunk, node, edge, closeness) for chunk in chunks)
+            return self._reduce_brandes_partials(partials, node, edge, closeness)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            partials = executor.map(_run_on_worker, repeat('_brandes_chunk'), chunks,
+                                    repeat(node), repeat(edge), repeat(closeness))
+            return self._reduce_brandes_partials(partials, node, edge, closeness)
+
+    @staticmethod
+    def _source_chunks(sources, chunk_size=None, max_chunks=64):
+        """Divide as origens em blocos contíguos de tamanho fixo."""
+        sources = list(sources)
+        if chunk_size is None:
+            chunk_size = max(1, -(-len(sources) // max_chunks))
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size inválido: {chunk_size}")
+        return [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+
+    def _reduce_brandes_partials(self, partials, node, edge, closeness=False):
+        """Soma as parciais de cada bloco, sempre na ordem dos blocos."""
+        node_scores = array('d', bytes(8 * self.num_vertices)) if node else None
+        edge_scores = {} if edge else None
+        closeness_scores = {} if closeness else None
+        for node_partial, edge_partial, closeness_partial in partials:
+            if node:
+                for v, score in enumerate(node_partial):
+                    node_scores[v] += score
+            if edge:
+                for key, score in edge_partial.items():
+                    edge_scores[key] = edge_scores.get(key, 0.0) + score
+            if closeness:
+                closeness_scores.update(closeness_partial)
+        return node_scores, edge_scores, closeness_scores
+
+    def _brandes_chunk(self, sources, node=True, edge=False, closeness=False):
+        """
+        Fase de acumulação de Brandes para um bloco de origens.
+        Os buffers (distâncias, contagens de caminhos, dependências, pilha e
+        predecessores) são alocados uma vez por bloco e, a cada origem, apenas as
+        posições alcançadas são restauradas. A pilha guarda os vértices na ordem em
+        que a busca os fixa (distância não decrescente), o que dispensa ordenar; os
+        predecessores formam listas encadeadas sobre dois buffers planos
+        (pred_vertex / pred_next), com o início da lista de cada vértice em pred_head.
+        Retorna as somas parciais (array por nó, dicionário por aresta) e a
+        proximidade de cada origem do bloco.
+        """
+        num_nodes = self.num_vertices
+        node_partial = array('d', bytes(8 * num_nodes)) if node else None
+        edge_partial = {} if edge else None
+        closeness_partial = {} if closeness else None
+
+        distances = [math.inf] * num_nodes
+        shortest_path_count = [0] * num_nodes
+        dependency = [0.0] * num_nodes
+        stack = [0] * num_nodes
+        pred_head = [-1] * num_nodes
+        # Cada aresta relaxada gera no máximo um registro de predecessor por origem
+        pred_vertex = [0] * self.num_edges
+        pred_next = [0] * self.num_edges
+
+        # Caminhos mínimos com BFS, Dial ou Dijkstra, conforme os pesos
+        profile = self._weight_profile()
+        search = (self._brandes_bfs if profile == 'unit' else
+                  self._brandes_dial if profile == 'int' else self._brandes_dijkstra)
+
+        for s in sources:
+            size = search(s, distances, shortest_path_count, stack, pred_head, pred_vertex, pred_next)
+            if closeness:
+                closeness_partial[s] = self._closeness_from_distances(s, distances, islice(stack, 1, size))
+
+            # Acumulação do mais distante para o mais próximo (folhas -> raiz); stack[0] é 's'
+            for i in range(size - 1, 0, -1):
+                w = stack[i]
+                # delta_v += (sigma_v / sigma_w) * (1 + delta_w) para cada predecessor v de w
+                coefficient = (1.0 + dependency[w]) / shortest_path_count[w]
+                k = pred_head[w]
+                while k != -1:
+                    v = pred_vertex[k]
+                    contrib = shortest_path_count[v] * coefficient
+                    dependency[v] += contrib
+                    if edge:
+                        # A contribuição de Betweenness da aresta (v -> w)
+                        edge_partial[(v, w)] = edge_partial.get((v, w), 0.0) + contrib
+                    k = pred_next[k]
+                if node:
+                    node_partial[w] += dependency[w]
+
+            # Restaura apenas as posições alcançadas a partir de 's'
+            for i in range(size):
+                v = stack[i]
+                distances[v] = math.inf
+                shortest_path_count[v] = 0
+                dependency[v] = 0.0
+                pred_head[v] = -1
+
+        return node_partial, edge_partial, closeness_partial
+
+    # As buscas abaixo preenchem os buffers de _brandes_chunk (que chegam zerados) e
+    # retornam quantos vértices foram fixados em 'stack', na ordem de fixação.
+
+    def _brandes_bfs(self, s, distances, shortest_path_count, stack, pred_head, pred_vertex, pred_next):
+        """BFS para pesos unitários: a própria pilha serve de fila."""
+        distances[s] = 0
+        shortest_path_count[s] = 1
+        stack[0] = s
+        head, size, k = 0, 1, 0
+        successors = self.successors
+
+        while head < size:
+            u = stack[head]
+            head += 1
+            next_distance = distances[u] + 1
+            count_u = shortest_path_count[u]
+            for v in successors(u):
+                d = distances[v]
+                if d == math.inf:
+                    distances[v] = next_distance
+                    stack[size] = v
+                    size += 1
+                elif d != next_distance:
+                    continue
+                shortest_path_count[v] += count_u
+                pred_vertex[k] = u
+                pred_next[k] = pred_head[v]
+                pred_head[v] = k
+                k += 1
+        return size
+
+    def _brandes_dial(self, s, distances, shortest_path_count, stack, pred_head, pred_vertex, pred_next):
+        """Fila de baldes de Dial para pesos inteiros em [1, MAX_BUCKET_WEIGHT]."""
+        distances[s] = 0
+        shortest_path_count[s] = 1
+        ring_size = MAX_BUCKET_WEIGHT + 1
+        buckets = [[] for _ in range(ring_size)]
+        buckets[0].append(s)
+        pending = 1
+        current_distance = 0
+        size, k = 0, 0
+        out_edges = self.out_edges
+
+        while pending:
+            bucket = buckets[current_distance % ring_size]
+            while not bucket:
+                current_distance += 1
+                bucket = buckets[current_distance % ring_size]
+            u = bucket.pop()
+            pending -= 1
+            if distances[u] != current_distance:
+                continue # entrada obsoleta
+
+            stack[size] = u
+            size += 1
+            count_u = shortest_path_count[u]
+            for v, weight in out_edges(u):
+                distance = current_distance + int(weight)
+                d = distances[v]
+                if distance < d:
+                    # Novo caminho mais curto: descarta os predecessores anteriores
+                    distances[v] = distance
+                    shortest_path_count[v] = count_u
+                    pred_head[v] = -1
+                    buckets[distance % ring_size].append(v)
+                    pending += 1
+                elif distance == d:
+                    shortest_path_count[v] += count_u
+                else:
+                    continue
+                pred_vertex[k] = u
+                pred_next[k] = pred_head[v]
+                pred_head[v] = k
+                k += 1
+        return size
+
+    def _brandes_dijkstra(self, s, distances, shortest_path_count, stack, pred_head, pred_vertex, pred_next):
+        """Dijkstra com heap para pesos quaisquer; a pilha segue a ordem de remoção do heap."""
+        distances[s] = 0.0
+        shortest_path_count[s] = 1
+        priority_queue = [(0.0, s)]
+        size, k = 0, 0
+        out_edges = self.out_edges
+
+        while priority_queue:
+            current_distance, u = heapq.heappop(priority_queue)
+            if current_distance > distances[u]:
+                continue # entrada obsoleta
+
+            stack[size] = u
+            size += 1
+            count_u = shortest_path_count[u]
+            for v, weight in out_edges(u):
+                distance = current_distance + weight
+                d = distances[v]
+                if distance < d:
+                    distances[v] = distance
+                    shortest_path_count[v] = count_u
+                    pred_head[v] = -1
+                    heapq.heappush(priority_queue, (distance, v))
+                elif distance == d:
+                    shortest_path_count[v] += count_u
+                else:
+                    continue
+                pred_vertex[k] = u
+                pred_next[k] = pred_head[v]
+                pred_head[v] = k
+                k += 1
+        return size
+
+    @cached_metric()
+    def eigenvector_centrality(self, max_iterations=100, tolerance=1.0e-6, start=None, norm='l2', as_array=False):
         """
         Calcula a centralidade do autovetor para todos os nós usando o método de potência.
+        Cada iteração é um produto matriz-vetor esparso sobre as arestas de entrada,
+        O(V + E). A estrutura CSR e as faixas por linha são montadas uma vez; os scores
+        alternam entre dois vetores fixos, mas os produtos por aresta (tamanho E) e as
+        fatias somadas por linha ainda são listas temporárias criadas a cada iteração.
+        - start: vetor inicial (dicionário ou sequência indexada por nó), ex: o
+          resultado de uma chamada anterior, para convergir em poucas iterações.
+        - norm: norma usada para normalizar e medir a convergência ('l2', 'l1' ou 'max').
+        - as_array: devolve um array('d') indexado por nó em vez de um dicionário.
         Retorna: Um dicionário {node: eigenvector_score}.
         """
         num_nodes = self.num_vertices
         if num_nodes == 0:
-            return {}
-        
-        # Inicializa o vetor de centralidade com valores iguais
-        centrality = {node: 1.0 / num_nodes for node in range(num_nodes)}
+            return array('d') if as_array else {}
+        norm_of = self._vector_norm(norm)
+
+        # Matriz transposta em CSR: as arestas v -> u de cada u ocupam a faixa row_slices[u]
+        offsets, sources, weights = self._in_edge_arrays()
+        row_slices = [slice(offsets[u], offsets[u + 1]) for u in range(num_nodes)]
+
+        # Inicializa o vetor de centralidade com valores iguais (ou com 'start')
+        if start is None:
+            centrality = [1.0 / num_nodes] * num_nodes
+        else:
+            centrality = [float(start[node]) for node in range(num_nodes)]
+            start_norm = norm_of(centrality)
+            if start_norm == 0.0:
+                centrality = [1.0 / num_nodes] * num_nodes
+            else:
+                centrality = [score / start_norm for score in centrality]
+        new_scores = [0.0] * num_nodes
 
-        #2 iterações do método de potência
+        # iterações do método de potência
         for _ in range(max_iterations):
-            new_scores = {node: 0.0 for node in range(num_nodes)}
-            norm_sum_sq = 0.0 # Soma dos quadrados para normalização
-
-            for u in range(num_nodes):
-                score_u = 0.0 # Score temporário para o nó u
-                
-                for v in range(num_nodes):
-                    if v in self.adj_list and u in self.adj_list[v]:
-                        weight = self.adj_list[v][u]
-                        score_u += weight * centrality[v]
-                
-                new_scores[u] = score_u
-                norm_sum_sq += score_u * score_u
+            # Produto peso * score de origem para todas as arestas, depois soma por linha
+            products = list(map(mul, weights, map(centrality.__getitem__, sources)))
+            new_scores[:] = map(sum, map(products.__getitem__, row_slices))
 
             # Normaliza os novos scores
-            norm = math.sqrt(norm_sum_sq)
-            if norm > 0:
-                #verifica convergência
-                diff_sq=0.0
-                for node in range(num_nodes):
-                    new_scores[node] /= norm
-                    # Calcula a diferença ao quadrado para verificação de convergência
-                    diff_sq += (new_scores[node] - centrality[node]) ** 2
-            
+            scale = norm_of(new_scores)
+            if scale == 0.0:
+                centrality = [0.0] * num_nodes # caso em que todos os scores são zeros
+                break
+            new_scores[:] = [score / scale for score in new_scores]
+
             # Verifica se convergiu ao critério de tolerância
-            if math.sqrt(diff_sq) < tolerance:
-                return new_scores
-            
-            # Atualiza os scores para a próxima iteração
-            centrality = new_scores
+            diff = norm_of(a - b for a, b in zip(new_scores, centrality))
+            # Troca os buffers para a próxima iteração
+            centrality, new_scores = new_scores, centrality
+            if diff < tolerance:
+                break
+
+        if as_array:
+            return array('d', centrality)
+        return dict(enumerate(centrality))
+
+    @cached_metric()
+    def get_pagerank(self, damping=0.85, personalization=None, max_iterations=100, tolerance=1.0e-6,
+                     weighted=True, start=None, incremental=False, as_array=False):
+        """
+        Calcula o PageRank ponderado de todos os nós pelo método de potência.
+        A cada passo, um nó v repassa 'damping' do seu score aos sucessores, na proporção
+        peso(v, u) / força de saída de v; o restante vai para o vetor de personalização.
+        Nós sem arestas de saída (sumidouros, ex: autores de issues que nunca respondem)
+        redistribuem todo o score conforme a personalização, em vez de perdê-lo.
+        - personalization: {node: peso} ou sequência (padrão: uniforme); é normalizada.
+        - weighted: usa os pesos das arestas (False: todas as arestas valem 1).
+        - start: vetor inicial; incremental=True parte do resultado da chamada anterior
+          (ex: depois de um lote de add_edges_from), convergindo em poucas iterações.
+        - tolerance: critério de parada na norma L1 da diferença entre iterações.
+        A matriz de transição é montada uma vez e os ranks alternam entre dois vetores
+        fixos; os produtos por aresta (tamanho E) são temporários de cada iteração.
+        Retorna: Um dicionário {node: pagerank} (soma 1), ou array('d') com as_array=True.
+        """
+        num_nodes = self.num_vertices
+        if num_nodes == 0:
+            return array('d') if as_array else {}
+        if not 0.0 <= damping <= 1.0:
+            raise ValueError(f"damping deve estar em [0, 1]: {damping}")
+
+        # Vetor de teletransporte (também recebe a massa dos sumidouros)
+        if personalization is None:
+            teleport = [1.0 / num_nodes] * num_nodes
         else:
-            return new_scores #caso em que todos os scores são zeros
+            if isinstance(personalization, dict):
+                teleport = [float(personalization.get(node, 0.0)) for node in range(num_nodes)]
+            else:
+                teleport = [float(value) for value in personalization]
+            total = sum(teleport)
+            if len(teleport) != num_nodes or total <= 0.0 or min(teleport) < 0.0:
+                raise ValueError("personalization deve ter um valor >= 0 por nó e soma positiva.")
+            teleport = [value / total for value in teleport]
 
-        return  centrality     
+        # Matriz de transição transposta em CSR: peso(v, u) / força de saída de v.
+        # Força de saída 0.0 (sem arestas ou só arestas de peso 0) faz de v um sumidouro:
+        # suas arestas recebem transição 0 e sua massa vai para o teletransporte
+        offsets, sources, weights = self._in_edge_arrays()
+        if weighted:
+            out_strength = [0.0] * num_nodes
+            for v, w in zip(sources, weights):
+                out_strength[v] += w
+        else:
+            out_strength = [float(self.get_vertex_out_degree(v)) for v in range(num_nodes)]
+            weights = repeat(1.0)
+        inverse_strength = [1.0 / strength if strength != 0.0 else 0.0 for strength in out_strength]
+        transition = [w * inverse_strength[v] for v, w in zip(sources, weights)]
+        dangling = [v for v in range(num_nodes) if out_strength[v] == 0.0]
+        row_slices = [slice(offsets[u], offsets[u + 1]) for u in range(num_nodes)]
+
+        # Vetor inicial: 'start', resultado anterior (incremental) ou uniforme
+        if start is None and incremental and self._last_pagerank is not None:
+            start = list(self._last_pagerank)
+            # Vértices criados depois da última chamada entram com a média uniforme
+            start.extend([1.0 / num_nodes] * (num_nodes - len(start)))
+        if start is None:
+            ranks = [1.0 / num_nodes] * num_nodes
+        else:
+            ranks = [float(start[node]) for node in range(num_nodes)]
+            total = sum(ranks)
+            ranks = [rank / total for rank in ranks] if total > 0.0 else [1.0 / num_nodes] * num_nodes
+        new_ranks = [0.0] * num_nodes
+
+        for _ in range(max_iterations):
+            # Massa dos sumidouros + teletransporte, distribuídos conforme a personalização
+            dangling_mass = sum(ranks[v] for v in dangling)
+            base = damping * dangling_mass + (1.0 - damping)
+            products = list(map(mul, transition, map(ranks.__getitem__, sources)))
+            new_ranks[:] = [damping * incoming + base * jump for incoming, jump in
+                            zip(map(sum, map(products.__getitem__, row_slices)), teleport)]
+
+            diff = sum(abs(a - b) for a, b in zip(new_ranks, ranks))
+            # Troca os buffers para a próxima iteração
+            ranks, new_ranks = new_ranks, ranks
+            if diff < tolerance:
+                break
+
+        self._last_pagerank = array('d', ranks)
+        if as_array:
+            return array('d', ranks)
+        return dict(enumerate(ranks))
+
+    def _in_edge_arrays(self):
+        """
+        Arestas de entrada em formato CSR: (offsets, origens, pesos), com as arestas
+        v -> u de cada u em origens[offsets[u]:offsets[u + 1]].
+        """
+        offsets = [0]
+        sources = []
+        weights = []
+        for u in range(self.num_vertices):
+            for v, w in self.in_edges(u):
+                sources.append(v)
+                weights.append(w)
+            offsets.append(len(sources))
+        return offsets, sources, weights
+
+    @staticmethod
+    def _vector_norm(norm):
+        """Função que calcula a norma escolhida ('l2', 'l1' ou 'max') de um vetor."""
+        if norm == 'l2':
+            return lambda vector: math.sqrt(sum(x * x for x in vector))
+        if norm == 'l1':
+            return lambda vector: sum(map(abs, vector))
+        if norm == 'max':
+            return lambda vector: max(map(abs, vector), default=0.0)
+        raise ValueError(f"Norma inválida: {norm} (use 'l2', 'l1' ou 'max')")
 
 
     # --- Metricas de estrutura ---
@@ -323,78 +942,301 @@ class AdjacencyListGraph(AbstractGraph):
 
         return existing_edges / max_edges
     
+    @cached_metric()
     def get_clustering_coefficient(self, u):
         """
         Calcula o coeficiente de aglomeração do vértice u
         """
         self.validate_index(u)
-        neighbors = list(self.adj_list[u].keys())
+        neighbors = set(self.successors(u))
         k = len(neighbors)
 
         if k < 2:
             return 0.0
-        
-        #maximo de conexões possíveis entre os vizinhos
-        possible_connections = k * (k - 1) / 2
-        # Conta conexões entre os vizinhos
-        connections = 0
-        #conta todas as conexões entre os vizinhos
 
+        #maximo de conexões possíveis entre os vizinhos (pares ordenados v -> w)
+        possible_connections = k * (k - 1)
+        #conta todas as conexões entre os vizinhos (interseção de conjuntos, sem pares v, w em Python)
+        connections = 0
         for v in neighbors:
-            for w in neighbors:
-                if v != w and self.has_edge(v, w): #verifica se existe conexão entre os vizinhos
-                    connections += 1
-        if possible_connections == 0:
-            return 0.0
+            connections += len(neighbors.intersection(self.successors(v)))
         return connections / possible_connections
-    
-    def get_assortativity_coefficient(self):
+
+    @cached_metric()
+    def get_clustering_coefficients(self, directed=True):
+        """
+        Coeficiente de aglomeração de todos os vértices, a média e a transitividade
+        global em uma única passada de contagem de triângulos.
+        directed=True: vizinhança de saída, como get_clustering_coefficient (arestas
+        v -> w entre os sucessores de u sobre k * (k - 1) pares ordenados).
+        directed=False: visão não dirigida (u ~ v se existe u -> v ou v -> u);
+        triângulos contados uma vez cada, orientando as arestas do vértice de menor
+        grau para o de maior grau, e os vizinhos comuns obtidos por interseção de
+        conjuntos, o que evita o custo quadrático nos hubs.
+        A transitividade é a razão global: conexões fechadas / pares possíveis.
+
+        Retorna: {'clustering': array indexado pelo ID do vértice,
+                  'average': média sobre todos os vértices, 'transitivity': float}.
+        """
+        n = self.num_vertices
+        closed = [0] * n # conexões (dirigido) ou triângulos (não dirigido) de cada vértice
+        neighbors = [set(self.successors(u)) for u in range(n)]
+
+        if directed:
+            for u in range(n):
+                successors = neighbors[u]
+                if len(successors) > 1:
+                    closed[u] = sum(len(successors & neighbors[v]) for v in successors)
+            possible = [len(s) * (len(s) - 1) for s in neighbors]
+        else:
+            for u in range(n):
+                for v in self.predecessors(u):
+                    neighbors[u].add(v)
+            # Ordem de grau (desempate pelo ID): cada aresta aponta para o vértice de maior posto
+            rank = [0] * n
+            for position, u in enumerate(sorted(range(n), key=lambda u: len(neighbors[u]))):
+                rank[u] = position
+            higher = [{v for v in neighbors[u] if rank[v] > rank[u]} for u in range(n)]
+            for u in range(n):
+                higher_u = higher[u]
+                for v in higher_u:
+                    common = higher_u & higher[v]
+                    if common:
+                        closed[u] += len(common)
+                        closed[v] += len(common)
+                        for w in common:
+                            closed[w] += 1
+            possible = [len(s) * (len(s) - 1) // 2 for s in neighbors]
+
+        clustering = array('d', bytes(8 * n))
+        for u in range(n):
+            if possible[u]:
+                clustering[u] = closed[u] / possible[u]
+
+        total_possible = sum(possible)
+        return {
+            'clustering': clustering,
+            'average': sum(clustering) / n if n else 0.0,
+            'transitivity': sum(closed) / total_possible if total_possible else 0.0,
+        }
+
+    # Variantes de assortatividade: (grau da origem u, grau do destino v) em cada aresta u -> v
+    ASSORTATIVITY_VARIANTS = ('out-in', 'in-out', 'out-out', 'in-in')
+
+    def get_degree_statistics(self):
+        """
+        Estatísticas de grau calculadas em uma única varredura das arestas, O(V + E):
+        - 'in_degree', 'out_degree', 'degree' (entrada + saída): arrays por vértice;
+        - 'in_strength', 'out_strength': somas dos pesos das arestas de entrada/saída;
+        - 'degree_centrality': grau total normalizado por N - 1;
+        - 'in_histogram', 'out_histogram', 'degree_histogram': {grau: quantidade de vértices};
+        - 'assortativity': {variante: coeficiente} para 'out-in', 'in-out', 'out-out' e 'in-in';
+        - 'density': densidade da rede.
+        """
+        return _copy_result(self._degree_statistics())
+
+    @cached_metric(copy=False)
+    def _degree_statistics(self):
+        """Estatísticas de grau em cache, sem cópia: apenas para leitura."""
+        n = self.num_vertices
+        out_degree = array('q', [self.get_vertex_out_degree(u) for u in range(n)])
+        in_degree = array('q', [self.get_vertex_in_degree(u) for u in range(n)])
+        degree = array('q', map(sum, zip(in_degree, out_degree)))
+        out_strength = array('d', bytes(8 * n))
+        in_strength = array('d', bytes(8 * n))
+
+        # Somas para a correlação de Pearson: graus da origem (x) e do destino (y)
+        sum_out_u = sum_out_u2 = sum_in_u = sum_in_u2 = 0
+        sum_out_v = sum_out_v2 = sum_in_v = sum_in_v2 = 0
+        sum_out_out = sum_out_in = sum_in_out = sum_in_in = 0
+        m = 0
+        for u in range(n):
+            out_u, in_u = out_degree[u], in_degree[u]
+            strength = 0.0
+            for v, w in self.out_edges(u):
+                strength += w
+                in_strength[v] += w
+                out_v, in_v = out_degree[v], in_degree[v]
+                sum_out_v += out_v
+                sum_out_v2 += out_v * out_v
+                sum_in_v += in_v
+                sum_in_v2 += in_v * in_v
+                sum_out_out += out_u * out_v
+                sum_out_in += out_u * in_v
+                sum_in_out += in_u * out_v
+                sum_in_in += in_u * in_v
+            out_strength[u] = strength
+            # Os termos da origem dependem só de u: somados uma vez por vértice
+            sum_out_u += out_u * out_u
+            sum_out_u2 += out_u * out_u * out_u
+            sum_in_u += in_u * out_u
+            sum_in_u2 += in_u * in_u * out_u
+            m += out_u
+
+        def pearson(sum_x, sum_x2, sum_y, sum_y2, sum_xy):
+            numerator = m * sum_xy - sum_x * sum_y
+            denominator = math.sqrt((m * sum_x2 - sum_x * sum_x) * (m * sum_y2 - sum_y * sum_y))
+            return numerator / denominator if denominator else 0.0
+
+        assortativity = {
+            'out-in': pearson(sum_out_u, sum_out_u2, sum_in_v, sum_in_v2, sum_out_in),
+            'in-out': pearson(sum_in_u, sum_in_u2, sum_out_v, sum_out_v2, sum_in_out),
+            'out-out': pearson(sum_out_u, sum_out_u2, sum_out_v, sum_out_v2, sum_out_out),
+            'in-in': pearson(sum_in_u, sum_in_u2, sum_in_v, sum_in_v2, sum_in_in),
+        }
+
+        def histogram(values):
+            counts = {}
+            for value in values:
+                counts[value] = counts.get(value, 0) + 1
+            return dict(sorted(counts.items()))
+
+        return {
+            'in_degree': in_degree, 'out_degree': out_degree, 'degree': degree,
+            'in_strength': in_strength, 'out_strength': out_strength,
+            'degree_centrality': array('d', [d / (n - 1) for d in degree]) if n > 1 else array('d', bytes(8 * n)),
+            'in_histogram': histogram(in_degree), 'out_histogram': histogram(out_degree),
+            'degree_histogram': histogram(degree),
+            'assortativity': assortativity,
+            'density': m / (n * (n - 1)) if n > 1 else 0.0,
+        }
+
+    @cached_metric()
+    def get_assortativity_coefficient(self, variant='out-in'):
         """
         Calcula o coeficiente de Assortatividade (Correlação de Grau Out-In).
         Mede a correlação entre o grau de saída (out-degree) de um nó de origem (u) 
         e o grau de entrada (in-degree) de seu vizinho de destino (v).        
+        'variant' escolhe os graus comparados em cada aresta u -> v: 'out-in' (padrão),
+        'in-out', 'out-out' ou 'in-in'. Todas saem da mesma varredura (ver get_degree_statistics).
         Retorna um valor entre -1 e 1.
         """
-        # Calcula as médias necessárias
-        m = self.get_edge_count()
-        if m == 0:
-            return 0.0
-        
-        #armazena os graus de saída e entrada
-        out_degrees = {u:self.get_vertex_out_degree(u) for u in range(self.num_vertices)}
-        in_degrees = {v:self.get_vertex_in_degree(v) for v in range(self.num_vertices)}
-
-        # variáveis para a formula de correlação de Pearson
-        sum_x = 0.0
-        sum_y = 0.0
-        sum_x2 = 0.0
-        sum_y2 = 0.0
-        sum_xy = 0.0
-
-        #itera sobre todas as arestas para calcular os somatórios
-        for u in range(self.num_vertices):
-            for v in self.adj_list[u].keys():
-                x= out_degrees[u] # grau de saída de u
-                y= in_degrees[v]  # grau de entrada de v
-
-                sum_x += x
-                sum_y += y
-                sum_x2 += x * x
-                sum_y2 += y * y
-                sum_xy += x * y
-
-        # Calcula a correlação de Pearson
-        numerator = m * sum_xy - sum_x * sum_y
-        denominator = math.sqrt((m * sum_x2 - sum_x * sum_x) * (m * sum_y2 - sum_y * sum_y))
-        if denominator == 0:
-            return 0.0
-        return numerator / denominator
-    
+        if variant not in self.ASSORTATIVITY_VARIANTS:
+            raise ValueError(f"Variante de assortatividade inválida: {variant} "
+                             f"(use uma de {', '.join(self.ASSORTATIVITY_VARIANTS)})")
+        return self._degree_statistics()['assortativity'][variant]
+
+    # --- Decomposição em núcleos (k-core) ---
+    @cached_metric()
+    def get_core_numbers(self, mode='all', weighted=False):
+        """
+        Número de núcleo de cada vértice: o maior k tal que o vértice pertence ao
+        k-core, o subgrafo máximo em que todos os vértices têm grau >= k.
+        - mode: grau usado, 'all' (entrada + saída), 'in' ou 'out'.
+        - weighted=False: algoritmo de Batagelj-Zaversnik, O(V + E), com os vértices
+          mantidos em baldes por grau e removidos do menor grau para o maior.
+        - weighted=True: s-core, em que o grau é a força (soma dos pesos); remoção
+          pela menor força com um heap, O(E log V).
+        Retorna: array indexado pelo ID do vértice (inteiros, ou floats se weighted=True).
+        """
+        if mode not in ('all', 'in', 'out'):
+            raise ValueError(f"Modo de núcleo inválido: {mode} (use 'all', 'in' ou 'out')")
+        n = self.num_vertices
+        # Ao remover v, perdem grau: todos os vizinhos ('all'), os sucessores ('in')
+        # ou os predecessores ('out'); o s-core precisa também dos pesos
+        if weighted:
+            forward, backward = self.out_edges, self.in_edges
+        else:
+            forward, backward = self.successors, self.predecessors
+        if mode == 'all':
+            def affected(v):
+                return chain(forward(v), backward(v))
+        else:
+            affected = forward if mode == 'in' else backward
+        if weighted:
+            return self._weighted_core_numbers(affected)
+
+        if mode == 'in':
+            degree = [self.get_vertex_in_degree(v) for v in range(n)]
+        elif mode == 'out':
+            degree = [self.get_vertex_out_degree(v) for v in range(n)]
+        else:
+            degree = [self.get_vertex_in_degree(v) + self.get_vertex_out_degree(v) for v in range(n)]
+
+        # Ordenação por contagem: 'order' lista os vértices por grau crescente,
+        # 'position' é o índice de cada vértice em 'order' e bucket_start[d] o
+        # início do balde de grau d
+        max_degree = max(degree, default=0)
+        bucket_start = [0] * (max_degree + 1)
+        for d in degree:
+            bucket_start[d] += 1
+        start = 0
+        for d in range(max_degree + 1):
+            count = bucket_start[d]
+            bucket_start[d] = start
+            start += count
+        position = [0] * n
+        order = [0] * n
+        for v in range(n):
+            position[v] = bucket_start[degree[v]]
+            order[position[v]] = v
+            bucket_start[degree[v]] += 1
+        for d in range(max_degree, 0, -1):
+            bucket_start[d] = bucket_start[d - 1]
+        bucket_start[0] = 0
+
+        for i in range(n):
+            v = order[i]
+            degree_v = degree[v]
+            for u in affected(v):
+                degree_u = degree[u]
+                if degree_u > degree_v:
+                    # Move u para o início do seu balde e o balde passa a começar depois dele
+                    first = bucket_start[degree_u]
+                    w = order[first]
+                    if u != w:
+                        position_u = position[u]
+                        order[position_u], order[first] = w, u
+                        position[w], position[u] = position_u, first
+                    bucket_start[degree_u] += 1
+                    degree[u] = degree_u - 1
+
+        return array('q', degree)
+
+    def _weighted_core_numbers(self, affected):
+        """s-core: remove sempre o vértice de menor força restante (heap com entradas obsoletas)."""
+        n = self.num_vertices
+        strength = [0.0] * n
+        for v in range(n):
+            for u, w in affected(v):
+                strength[u] += w
+        removed = [False] * n
+        core = array('d', bytes(8 * n))
+        priority_queue = [(strength[v], v) for v in range(n)]
+        heapq.heapify(priority_queue)
+        current = 0.0
+
+        while priority_queue:
+            value, v = heapq.heappop(priority_queue)
+            if removed[v] or value != strength[v]:
+                continue # entrada obsoleta
+            removed[v] = True
+            if value > current:
+                current = value
+            core[v] = current
+            for u, w in affected(v):
+                if not removed[u]:
+                    strength[u] -= w
+                    heapq.heappush(priority_queue, (strength[u], u))
+        return core
+
+    def get_k_core(self, k, mode='all', weighted=False):
+        """
+        IDs dos vértices do k-core (número de núcleo >= k), em ordem crescente.
+        Combine com induced_subgraph para rodar métricas caras só no núcleo da rede.
+        """
+        core = self.get_core_numbers(mode, weighted)
+        return [v for v in range(self.num_vertices) if core[v] >= k]
+
     # --- Metricas de comunidade ---
-    def get_edge_betweenness_centrality(self):
+    @cached_metric()
+    def get_edge_betweenness_centrality(self, workers=None, chunk_size=None,
+                                        samples=None, epsilon=None, delta=0.1, seed=None):
         """
         Calcula a Centralidade de Intermediação de Aresta (Edge Betweenness Centrality) 
         usando uma adaptação do Algoritmo de Brandes (Dijkstra).
+        Aceita 'workers', 'chunk_size' e a amostragem de origens
+        ('samples', 'epsilon', 'delta', 'seed') como get_betweenness_centrality.
     
         Retorna: Um dicionário de scores {(u, v): score}.
         """
@@ -402,57 +1244,32 @@ class AdjacencyListGraph(AbstractGraph):
         # Inicializa o score de intermediação de aresta para todas as arestas existentes
         edge_betweenness = {}
         for u in range(num_nodes):
-            for v in self.adj_list[u].keys():
+            for v in self.successors(u):
                 edge_betweenness[(u, v)] = 0.0
 
-        # Itera sobre cada nó 's' como a origem (source)
-        for s in range(num_nodes):
-            # O Dijkstra já retorna: distâncias, predecessores, e contagem de caminhos mais curtos
-            distances, predecessors, shortest_path_count = self.dijkstra(s)
-            
-            stack = []
-            dependency = {node: 0.0 for node in range(num_nodes)}
-            
-            # Ordena os nós por distância decrescente para processar de trás para frente
-            sorted_nodes = [node for node in range(num_nodes) if distances[node] != float('inf')]
-            sorted_nodes.sort(key=lambda node: distances[node], reverse=True)
-            
-            for v in sorted_nodes:
-                if v != s:
-                    stack.append(v)
-            
-            # Fase de Acumulação para Arestas
-            while stack:
-                w = stack.pop()
-                
-                # Itera sobre os predecessores 'v' de 'w' no caminho mais curto
-                for v in predecessors[w]:
-                    
-                    # Proporção de caminhos mais curtos de s->w que passam por v
-                    if shortest_path_count[w] > 0 and shortest_path_count[w] > 0:
-                        fraction = shortest_path_count[v] / shortest_path_count[w]
-                    else:
-                        fraction = 0.0
-                        
-                    # A contribuição de Betweenness da aresta (v -> w)
-                    edge_contrib = fraction * (1.0 + dependency[w])
-                    
-                    # Adiciona a contribuição ao score da aresta (v, w)
-                    edge_betweenness[(v, w)] += edge_contrib
-                    
-                    # Acumula a dependência para o nó 'v'
-                    dependency[v] += edge_contrib
+        sources, scale = self._sample_sources(samples, epsilon, delta, seed, len(edge_betweenness))
+        _, edge_scores, _ = self._brandes_sweep(sources, node=False, edge=True,
+                                                workers=workers, chunk_size=chunk_size)
+        for key, score in edge_scores.items():
+            edge_betweenness[key] = score * scale
 
         return edge_betweenness
     
-    def get_bridge_ties(self, top_n=10): #top_n é o número de pontes a retornar, ou seja, o top 10 mais significativas
+    @cached_metric()
+    def get_bridge_ties(self, top_n=10, edge_betweenness=None, **sampling): #top_n é o número de pontes a retornar, ou seja, o top 10 mais significativas
         """
-        Identifica todas as pontes (bridges) no grafo.
-        Uma ponte é uma aresta que, se removida, aumenta o número de componentes conectados do grafo.
+        Ordena as arestas pela intermediação de aresta: as mais altas ligam grupos
+        que dependem delas para se comunicar (laços ponte).
+        Para as pontes em sentido estrito (arestas cuja remoção desconecta o grafo)
+        use get_bridges, que não exige a varredura de Brandes.
+        'edge_betweenness' permite reaproveitar scores já calculados
+        (ex: get_combined_centralities()['edge_betweenness']); os demais argumentos
+        ('samples', 'epsilon', 'delta', 'seed', ...) vão para get_edge_betweenness_centrality.
         
         Retorna: Uma lista de tuplas representando as pontes [(u1, v1), (u2, v2), ...].
         """
-        edge_betweenness = self.get_edge_betweenness_centrality()
+        if edge_betweenness is None:
+            edge_betweenness = self.get_edge_betweenness_centrality(**sampling)
     
         # Ordena as arestas pelo score em ordem decrescente
         # item[1] é o score
@@ -471,52 +1288,462 @@ class AdjacencyListGraph(AbstractGraph):
 
 
         return bridging_ties_list
+
+    @cached_metric()
+    def get_bridges(self):
+        """
+        Pontes da visão não dirigida simples do grafo (u ~ v se existe u -> v ou v -> u):
+        arestas cuja remoção aumenta o número de componentes conexos.
+        Busca em profundidade de Tarjan (low-link) iterativa, O(V + E), sem recursão.
+
+        Retorna: lista de tuplas (rótulo_u, rótulo_v), com u < v por ID, em ordem de ID.
+        """
+        bridges, _ = self._bridges_and_articulation_points()
+        return [(self.get_label(u), self.get_label(v)) for u, v in bridges]
+
+    @cached_metric()
+    def get_articulation_points(self):
+        """
+        Pontos de articulação da visão não dirigida simples do grafo: vértices cuja
+        remoção aumenta o número de componentes conexos (pontos únicos de falha).
+        Mesma busca de get_bridges, O(V + E).
+
+        Retorna: lista de rótulos, em ordem de ID.
+        """
+        _, articulation = self._bridges_and_articulation_points()
+        return [self.get_label(u) for u in articulation]
+
+    def _bridges_and_articulation_points(self):
+        """
+        DFS de Tarjan com pilha explícita: cada entrada guarda o vértice, o pai na
+        árvore e o iterador dos vizinhos ainda não examinados.
+        low[u] é o menor tempo de descoberta alcançável pela subárvore de u usando uma
+        aresta de retorno; a aresta pai-filho é ponte se low[filho] > disc[pai].
+
+        Retorna: (lista de pontes (u, v) com u < v, lista de pontos de articulação), por ID.
+        """
+        n = self.num_vertices
+        neighbors = [set(self.successors(u)) for u in range(n)]
+        for u in range(n):
+            for v in self.predecessors(u):
+                neighbors[u].add(v)
+
+        discovery = [-1] * n
+        low = [0] * n
+        is_articulation = [False] * n
+        bridges = []
+        clock = 0
+
+        for root in range(n):
+            if discovery[root] != -1:
+                continue
+            discovery[root] = low[root] = clock
+            clock += 1
+            root_children = 0
+            stack = [(root, -1, iter(neighbors[root]))]
+
+            while stack:
+                u, parent, pending = stack[-1]
+                descended = False
+                for v in pending:
+                    if discovery[v] == -1:
+                        discovery[v] = low[v] = clock
+                        clock += 1
+                        stack.append((v, u, iter(neighbors[v])))
+                        descended = True
+                        break
+                    if v != parent and discovery[v] < low[u]:
+                        low[u] = discovery[v] # aresta de retorno
+                if descended:
+                    continue
+
+                # Subárvore de u concluída: propaga low para o pai
+                stack.pop()
+                if parent == -1:
+                    continue
+                if low[u] < low[parent]:
+                    low[parent] = low[u]
+                if low[u] > discovery[parent]:
+                    bridges.append((parent, u) if parent < u else (u, parent))
+                if parent == root:
+                    root_children += 1
+                elif low[u] >= discovery[parent]:
+                    is_articulation[parent] = True
+
+            # A raiz é articulação se tem mais de um filho na árvore de busca
+            if root_children > 1:
+                is_articulation[root] = True
+
+        bridges.sort()
+        return bridges, [u for u in range(n) if is_articulation[u]]
     
+    @cached_metric()
     def get_connected_components(self):
         """
         Usa Busca em Largura para encontrar os Componentes Conexos do grafo.
         esta é uma forma para identificar grupos de usuários que podem se alcançar mutualmente.
+        Com track_components=True, usa o union-find mantido nas inserções.
         Retorna: Uma lista de comunidades (cada uma é uma lista de rótulos de usuário).
         """
+        if self.track_components:
+            return [[self.get_label(node_id) for node_id in group]
+                    for group in self._component_index().groups()]
+
         num_nodes = self.num_vertices
         visited = [False] * num_nodes
         communities = []
-        
-        def bfs(start_node):
-            queue = [start_node]
-            component_ids = set()
-            visited[start_node] = True
-            
-            while queue:
-                u = queue.pop(0)
-                component_ids.add(u)
-                
-                # Itera sobre todos os nós para encontrar vizinhos de entrada E saída de 'u'
-                for v in range(num_nodes):
-                    
-                    is_neighbor = False
-                    # 1. Vizinhos de Saída: u -> v
-                    if v in self.adj_list[u]:
-                        is_neighbor = True
-                    # 2. Vizinhos de Entrada: v -> u
-                    elif u in self.adj_list[v]:
-                        is_neighbor = True
-                    
-                    if is_neighbor and not visited[v]:
-                        visited[v] = True
-                        queue.append(v)
-                        
-            return component_ids
 
         for i in range(num_nodes):
             if not visited[i]:
-                component_ids = bfs(i)
+                # Vizinhos de saída (u -> v) e de entrada (v -> u) em O(V + E) no total
+                component_ids = self._weak_component_bfs(i, visited)
                 if component_ids:
                     # Converte os IDs de volta para rótulos (nomes de usuário)
                     community_labels = [self.get_label(node_id) for node_id in component_ids]
                     communities.append(community_labels)
                     
         return communities
+
+    # --- Detecção de comunidades por modularidade ---
+    def _undirected_weights(self):
+        """Visão não dirigida ponderada: lista de {v: w(u -> v) + w(v -> u)} por vértice."""
+        neighbors = [{} for _ in range(self.num_vertices)]
+        for u in range(self.num_vertices):
+            row = neighbors[u]
+            for v, w in self.out_edges(u):
+                row[v] = row.get(v, 0.0) + w
+                neighbors[v][u] = neighbors[v].get(u, 0.0) + w
+        return neighbors
+
+    def get_modularity(self, labels, resolution=1.0):
+        """
+        Modularidade da partição 'labels' (comunidade de cada vértice, indexada pelo ID)
+        na visão não dirigida ponderada do grafo.
+        """
+        if len(labels) != self.num_vertices:
+            raise ValueError(f"Esperado um rótulo por vértice ({self.num_vertices}), recebido {len(labels)}.")
+        neighbors = self._undirected_weights()
+        internal = {}
+        totals = {}
+        m2 = 0.0
+        for u, row in enumerate(neighbors):
+            c = labels[u]
+            strength = 0.0
+            inside = 0.0
+            for v, w in row.items():
+                strength += w
+                if labels[v] == c:
+                    inside += w
+            m2 += strength
+            totals[c] = totals.get(c, 0.0) + strength
+            internal[c] = internal.get(c, 0.0) + inside
+        if m2 == 0:
+            return 0.0
+        return sum(internal[c] / m2 - resolution * (totals[c] / m2) ** 2 for c in totals)
+
+    @cached_metric()
+    def get_modularity_communities(self, resolution=1.0, refine=False, seed=None, max_levels=None):
+        """
+        Detecção de comunidades por maximização de modularidade (método de Louvain) na
+        visão não dirigida ponderada do grafo (peso de u ~ v = w(u -> v) + w(v -> u)).
+        Cada nível move vértices para a comunidade vizinha de maior ganho de modularidade,
+        com as somas de grau por comunidade atualizadas a cada movimento, e depois agrega
+        cada comunidade em um único vértice para o nível seguinte.
+        Com refine=True (refinamento no estilo Leiden), cada comunidade é dividida em suas
+        partes conexas antes da agregação; as partes começam o nível seguinte na
+        comunidade de origem e podem voltar a se unir, mas nunca ficam desconexas.
+        'resolution' > 1 favorece comunidades menores; 'seed' fixa a ordem de visita.
+
+        Retorna: {'labels': array com a comunidade de cada vértice (numeradas por ordem de
+                  primeira aparição), 'modularity': float,
+                  'communities': lista de comunidades (rótulos), da maior para a menor}.
+        """
+        n = self.num_vertices
+        neighbors = self._undirected_weights()
+        strengths = [sum(row.values()) for row in neighbors]
+        m2 = sum(strengths)
+        rng = random.Random(seed)
+
+        # Nó do nível atual que representa cada vértice original
+        vertex_node = list(range(n))
+        membership = list(range(n))
+        levels = 0
+        while m2 > 0:
+            self._louvain_move(neighbors, strengths, membership, resolution, m2, rng)
+            if refine:
+                group, count = self._split_disconnected(neighbors, membership)
+            else:
+                group, count = self._renumber(membership)
+            if count == len(neighbors):
+                # Nada a agregar: a partição final é a deste nível
+                vertex_node = [group[node] for node in vertex_node]
+                break
+
+            # Agregação: cada grupo vira um nó; arestas internas viram peso próprio (em 'strengths')
+            aggregated = [{} for _ in range(count)]
+            for i, row in enumerate(neighbors):
+                target = aggregated[group[i]]
+                for j, w in row.items():
+                    gj = group[j]
+                    if gj != group[i]:
+                        target[gj] = target.get(gj, 0.0) + w
+            aggregated_strengths = [0.0] * count
+            parent = list(range(count))
+            for i in range(len(neighbors)):
+                aggregated_strengths[group[i]] += strengths[i]
+                parent[group[i]] = membership[i]
+            neighbors, strengths = aggregated, aggregated_strengths
+            vertex_node = [group[node] for node in vertex_node]
+            # Louvain recomeça com um nó por comunidade; Leiden com a comunidade de origem
+            membership = self._renumber(parent)[0] if refine else list(range(count))
+
+            levels += 1
+            if max_levels is not None and levels >= max_levels:
+                break
+
+        labels, count = self._renumber(vertex_node)
+        labels = array('i', labels)
+        members = [[] for _ in range(count)]
+        for v, c in enumerate(labels):
+            members[c].append(self.get_label(v))
+        members.sort(key=len, reverse=True)
+        return {'labels': labels, 'modularity': self.get_modularity(labels, resolution),
+                'communities': members}
+
+    @staticmethod
+    def _louvain_move(neighbors, strengths, membership, resolution, m2, rng):
+        """
+        Fase de movimentação local: cada nó vai para a comunidade vizinha de maior ganho,
+        ganho(c) = w(i, c) - resolution * total(c) * k_i / 2m. Os vizinhos de um nó que
+        mudou de comunidade voltam à fila; termina quando nenhum movimento melhora.
+        """
+        n = len(neighbors)
+        totals = [0.0] * n
+        for i in range(n):
+            totals[membership[i]] += strengths[i]
+        order = list(range(n))
+        rng.shuffle(order)
+        queue = deque(order)
+        queued = [True] * n
+        tolerance = 1e-12 * m2 # evita trocas infinitas por erro de arredondamento
+
+        while queue:
+            i = queue.popleft()
+            queued[i] = False
+            current = membership[i]
+            k_i = strengths[i]
+            links = {}
+            for j, w in neighbors[i].items():
+                c = membership[j]
+                links[c] = links.get(c, 0.0) + w
+
+            totals[current] -= k_i
+            factor = resolution * k_i / m2
+            best = current
+            best_gain = links.get(current, 0.0) - totals[current] * factor
+            for c, w in links.items():
+                gain = w - totals[c] * factor
+                if gain > best_gain + tolerance:
+                    best, best_gain = c, gain
+            totals[best] += k_i
+
+            if best != current:
+                membership[i] = best
+                for j in neighbors[i]:
+                    if not queued[j] and membership[j] != best:
+                        queued[j] = True
+                        queue.append(j)
+
+    @staticmethod
+    def _split_disconnected(neighbors, membership):
+        """Divide cada comunidade em partes conexas (DFS restrita à comunidade)."""
+        n = len(neighbors)
+        group = [-1] * n
+        count = 0
+        for s in range(n):
+            if group[s] == -1:
+                community = membership[s]
+                group[s] = count
+                stack = [s]
+                while stack:
+                    u = stack.pop()
+                    for v in neighbors[u]:
+                        if group[v] == -1 and membership[v] == community:
+                            group[v] = count
+                            stack.append(v)
+                count += 1
+        return group, count
+
+    @staticmethod
+    def _renumber(values):
+        """Renumera os valores como 0, 1, ... por ordem de primeira aparição."""
+        ids = {}
+        renumbered = [ids.setdefault(value, len(ids)) for value in values]
+        return renumbered, len(ids)
+
+    # --- Componentes fortemente conexos ---
+    @cached_metric()
+    def get_strongly_connected_components(self):
+        """
+        Componentes fortemente conexos: grupos em que todo usuário alcança todos os
+        outros seguindo a direção das arestas. Tarjan iterativo, O(V + E).
+
+        Retorna: lista de componentes (cada um uma lista de rótulos), do maior para o menor.
+        """
+        components, count = self._strong_components()
+        members = [[] for _ in range(count)]
+        for v in range(self.num_vertices):
+            members[components[v]].append(self.get_label(v))
+        members.sort(key=len, reverse=True)
+        return members
+
+    def get_condensation(self):
+        """
+        Grafo de condensação: cada componente fortemente conexo vira um nó e há uma
+        aresta c1 -> c2 se alguma aresta do grafo liga os dois componentes.
+        O resultado é um DAG; os componentes são numerados em ordem topológica, logo
+        toda aresta vai de um ID menor para um maior.
+
+        Retorna: {'components': array com o componente de cada vértice,
+                  'sizes': array com o tamanho de cada componente,
+                  'successors': lista com os componentes sucessores (ordenados) de cada componente}.
+        """
+        return _copy_result(self._condensation())
+
+    @cached_metric(copy=False)
+    def _condensation(self):
+        """Condensação em cache, sem cópia: apenas para leitura (ver get_condensation)."""
+        components, count = self._strong_components()
+        sizes = array('q', bytes(8 * count))
+        successors = [set() for _ in range(count)]
+        for u in range(self.num_vertices):
+            cu = components[u]
+            sizes[cu] += 1
+            for v in self.successors(u):
+                if components[v] != cu:
+                    successors[cu].add(components[v])
+        return {'components': components, 'sizes': sizes,
+                'successors': [sorted(targets) for targets in successors]}
+
+    def can_reach(self, u, v, condensation=None):
+        """
+        Verifica se existe caminho dirigido de u até v, sem calcular distâncias.
+        Busca no DAG de condensação apenas entre os componentes com ID entre o de u e o
+        de v (a numeração topológica descarta os demais). 'condensation' permite
+        reaproveitar o resultado de get_condensation() entre várias consultas.
+        """
+        self.validate_index(u)
+        self.validate_index(v)
+        if condensation is None:
+            condensation = self._condensation()
+        components, successors = condensation['components'], condensation['successors']
+        source, target = components[u], components[v]
+        if source == target:
+            return True
+        if source > target:
+            return False
+
+        visited = {source}
+        stack = [source]
+        while stack:
+            c = stack.pop()
+            for d in successors[c]:
+                if d == target:
+                    return True
+                if d < target and d not in visited:
+                    visited.add(d)
+                    stack.append(d)
+        return False
+
+    def _strong_components(self):
+        """
+        Tarjan com pilha explícita (vértice, iterador das arestas de saída pendentes).
+        Retorna (array com o componente de cada vértice, quantidade de componentes),
+        com os componentes numerados em ordem topológica do DAG de condensação.
+        """
+        n = self.num_vertices
+        discovery = [-1] * n
+        low = [0] * n
+        on_stack = [False] * n
+        scc_stack = []
+        components = array('i', bytes(4 * n))
+        count = 0
+        clock = 0
+
+        for root in range(n):
+            if discovery[root] != -1:
+                continue
+            discovery[root] = low[root] = clock
+            clock += 1
+            scc_stack.append(root)
+            on_stack[root] = True
+            work = [(root, self.successors(root))]
+
+            while work:
+                u, pending = work[-1]
+                descended = False
+                for v in pending:
+                    if discovery[v] == -1:
+                        discovery[v] = low[v] = clock
+                        clock += 1
+                        scc_stack.append(v)
+                        on_stack[v] = True
+                        work.append((v, self.successors(v)))
+                        descended = True
+                        break
+                    if on_stack[v] and discovery[v] < low[u]:
+                        low[u] = discovery[v]
+                if descended:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[u] < low[parent]:
+                        low[parent] = low[u]
+                if low[u] == discovery[u]:
+                    # u é a raiz de um componente: desempilha seus membros
+                    while True:
+                        w = scc_stack.pop()
+                        on_stack[w] = False
+                        components[w] = count
+                        if w == u:
+                            break
+                    count += 1
+
+        # Tarjan fecha os componentes em ordem topológica reversa
+        for v in range(n):
+            components[v] = count - 1 - components[v]
+        return components, count
+
+    def induced_subgraph(self, vertices):
+        """
+        Subgrafo induzido pelos vértices informados (IDs), com rótulos, pesos dos
+        vértices e pesos das arestas preservados. Útil para restringir métricas caras
+        (proximidade, intermediação) ao maior componente fortemente conexo.
+        Os vértices recebem novos IDs na ordem em que foram informados.
+        """
+        vertices = list(vertices)
+        new_id = {}
+        for v in vertices:
+            self.validate_index(v)
+            new_id.setdefault(v, len(new_id))
+        if len(new_id) != len(vertices):
+            raise ValueError("Vértices repetidos no subgrafo induzido.")
+
+        subgraph = AdjacencyListGraph(len(vertices))
+        for v, i in new_id.items():
+            subgraph.vertex_weights[i] = self.vertex_weights[v]
+            label = self.labels[v]
+            if label is not None:
+                subgraph.labels[i] = label
+                subgraph.label_to_id[label] = i
+        # Novos rótulos só podem ocupar posições após o último vértice rotulado
+        subgraph.count_vertices_used = max((i + 1 for i, label in enumerate(subgraph.labels)
+                                            if label is not None), default=0)
+        subgraph.add_edges_from((new_id[u], new_id[v], w)
+                                for u in vertices for v, w in self.out_edges(u) if v in new_id)
+        return subgraph
     
         
         
@@ -1,51 +1,195 @@
 from src.AbstractGraph import AbstractGraph
+from array import array
 
 class AdjacencyMatrixGraph(AbstractGraph):
     """
     Implementação utilizando Matriz de Adjacência.
+    Estrutura: a matriz é linearizada em um único buffer contíguo
+    ('matrix', um array de float64 ou float32) indexado por u * capacity + v,
+    onde capacity >= N é a largura reservada (ampliada em 25% quando o grafo
+    cresce, ou definida de uma vez por reserve).
+    Um bytearray paralelo ('mask') marca a presença das arestas (1 byte por
+    célula), o que permite varrer linhas/colunas em velocidade de C e
+    admite arestas de peso 0.0.
     """
 
-    def __init__(self, num_vertices): # [cite: 49]
-        super().__init__(num_vertices)
-        # Inicializa matriz N x N com None ou 0
-        # Usamos 0.0 para indicar ausência de aresta para facilitar lógica de pesos
-        self.matrix = [[0.0] * num_vertices for _ in range(num_vertices)]
+    def __init__(self, num_vertices=0, dtype='d', track_components=False): # [cite: 49]
+        super().__init__(num_vertices, track_components)
+        if dtype not in ('d', 'f'):
+            raise ValueError(f"dtype inválido: {dtype} (use 'd' para float64 ou 'f' para float32)")
+        self.dtype = dtype
+        # Pesos e presença das arestas, ambos com capacity * capacity células
+        self.capacity = num_vertices
+        self.matrix = self._new_weights(self.capacity)
+        self.mask = bytearray(self.capacity * self.capacity)
+        # Graus mantidos de forma incremental: consultas em O(1)
+        self.in_degrees = array('q', [0]) * num_vertices
+        self.out_degrees = array('q', [0]) * num_vertices
         self.num_edges = 0
 
+    def _new_weights(self, capacity):
+        # Repetição de um array de 1 elemento: aloca o buffer zerado uma única vez,
+        # sem um objeto bytes intermediário do mesmo tamanho
+        return array(self.dtype, [0.0]) * (capacity * capacity)
+
+    def reserve(self, num_vertices):
+        """
+        Realoca a matriz para largura 'num_vertices' (se maior que a atual),
+        copiando as linhas existentes. Custa O(capacity^2) uma única vez.
+        """
+        if num_vertices <= self.capacity:
+            return
+        n, old_capacity = self.num_vertices, self.capacity
+        self.capacity = num_vertices
+        matrix = self._new_weights(self.capacity)
+        mask = bytearray(self.capacity * self.capacity)
+        for u in range(n):
+            old, new = u * old_capacity, u * self.capacity
+            matrix[new:new + n] = self.matrix[old:old + n]
+            mask[new:new + n] = self.mask[old:old + n]
+        self.matrix = matrix
+        self.mask = mask
+
+    def _reserve_for(self, weighted_dict):
+        """
+        Conta os rótulos distintos de {origem: {destino: peso}} e reserva a largura
+        final antes de from_weighted_dict inserir: uma única realocação O(N^2).
+        """
+        labels = set(weighted_dict)
+        for targets in weighted_dict.values():
+            labels.update(targets)
+        labels.difference_update(self.label_to_id)
+        self.reserve(self.count_vertices_used + len(labels))
+
+    def _add_vertex_storage(self):
+        if self.num_vertices >= self.capacity:
+            # Crescimento geométrico moderado: as realocações O(N^2) continuam
+            # amortizadas, e a sobra fica em no máximo ~1.56x as N^2 células
+            # (fator 2 em cada dimensão chegaria a 4x)
+            self.reserve(max(self.capacity + 1, self.capacity * 5 // 4))
+        self.in_degrees.append(0)
+        self.out_degrees.append(0)
+
     def get_edge_count(self):
         return self.num_edges
 
     def has_edge(self, u, v):
         self.validate_index(u)
         self.validate_index(v)
-        return self.matrix[u][v] != 0.0
+        return self.mask[u * self.capacity + v] != 0
 
     def add_edge(self, u, v):
         self.validate_index(u)
         self.validate_index(v)
-        
+
         # Idempotente e sem laços [cite: 73, 74]
         if u == v:
             return # Não permite laços
-            
-        if not self.has_edge(u, v):
-            self.matrix[u][v] = 1.0 # Peso padrão inicial
+
+        k = u * self.capacity + v
+        if not self.mask[k]:
+            self.mask[k] = 1
+            self.matrix[k] = 1.0 # Peso padrão inicial
+            self.out_degrees[u] += 1
+            self.in_degrees[v] += 1
             self.num_edges += 1
+            if self._components is not None:
+                self._components.union(u, v)
+            self._bump_epoch()
+
+    def add_edges_from(self, edges):
+        """
+        Inserção em lote de arestas (u, v) ou (u, v, peso).
+        Equivale a add_edge seguido de set_edge_weight para cada item, mas
+        valida os índices inline e escreve direto nos buffers.
+        Sem peso, uma aresta nova recebe 1.0 e uma existente mantém o seu.
+        """
+        n, c = self.num_vertices, self.capacity
+        matrix, mask = self.matrix, self.mask
+        out_degrees, in_degrees = self.out_degrees, self.in_degrees
+        components = self._components
+        added = 0
+        try:
+            for edge in edges:
+                u, v = edge[0], edge[1]
+                if not (0 <= u < n and 0 <= v < n):
+                    raise ValueError(f"Índice de vértice inválido: {u if not 0 <= u < n else v}")
+                if u == v: continue # Sem laços
+
+                k = u * c + v
+                if not mask[k]:
+                    mask[k] = 1
+                    matrix[k] = float(edge[2]) if len(edge) > 2 else 1.0
+                    out_degrees[u] += 1
+                    in_degrees[v] += 1
+                    added += 1
+                    if components is not None:
+                        components.union(u, v)
+                elif len(edge) > 2:
+                    matrix[k] = float(edge[2])
+        finally:
+            # Mantém a contagem correta mesmo se um índice inválido interromper o lote
+            self.num_edges += added
+            self._bump_epoch()
 
     def remove_edge(self, u, v):
         if self.has_edge(u, v):
-            self.matrix[u][v] = 0.0
+            k = u * self.capacity + v
+            self.mask[k] = 0
+            self.matrix[k] = 0.0
+            self.out_degrees[u] -= 1
+            self.in_degrees[v] -= 1
             self.num_edges -= 1
+            self._invalidate_components()
+            self._bump_epoch()
 
     def set_edge_weight(self, u, v, w):
         if self.has_edge(u, v):
-            self.matrix[u][v] = float(w)
+            self.matrix[u * self.capacity + v] = float(w)
+            self._bump_epoch()
 
     def get_edge_weight(self, u, v):
         if self.has_edge(u, v):
-            return self.matrix[u][v]
+            return self.matrix[u * self.capacity + v]
         return 0.0
 
+    def _row_mask(self, u):
+        """Cópia (em C) da linha u da máscara: byte v != 0 se existe u -> v."""
+        start = u * self.capacity
+        return self.mask[start:start + self.num_vertices]
+
+    def _column_mask(self, v):
+        """Cópia (em C) da coluna v da máscara: byte u != 0 se existe u -> v."""
+        return self.mask[v:self.num_vertices * self.capacity:self.capacity]
+
+    @staticmethod
+    def _set_positions(byte_mask):
+        """Índices dos bytes não nulos (cada busca é um memchr)."""
+        k = byte_mask.find(1)
+        while k != -1:
+            yield k
+            k = byte_mask.find(1, k + 1)
+
+    def out_edges(self, u):
+        """Pares (v, peso) das arestas u -> v (varre a linha u sob demanda)."""
+        base = u * self.capacity
+        matrix = self.matrix
+        return ((v, matrix[base + v]) for v in self._set_positions(self._row_mask(u)))
+
+    def in_edges(self, v):
+        """Pares (u, peso) das arestas u -> v (varre a coluna v sob demanda)."""
+        c = self.capacity
+        matrix = self.matrix
+        return ((u, matrix[u * c + v]) for u in self._set_positions(self._column_mask(v)))
+
+    def successors(self, u):
+        """IDs v das arestas u -> v."""
+        return self._set_positions(self._row_mask(u))
+
+    def predecessors(self, v):
+        """IDs u das arestas u -> v."""
+        return self._set_positions(self._column_mask(v))
+
     # --- Lógica de Grafos ---
 
     def is_successor(self, u, v):
@@ -75,19 +219,11 @@ class AdjacencyMatrixGraph(AbstractGraph):
 
     def get_vertex_in_degree(self, u):
         self.validate_index(u)
-        degree = 0
-        for i in range(self.num_vertices):
-            if self.matrix[i][u] != 0.0:
-                degree += 1
-        return degree
+        return self.in_degrees[u]
 
     def get_vertex_out_degree(self, u):
         self.validate_index(u)
-        degree = 0
-        for j in range(self.num_vertices):
-            if self.matrix[u][j] != 0.0:
-                degree += 1
-        return degree
+        return self.out_degrees[u]
 
     def is_empty_graph(self):
         return self.num_edges == 0
@@ -97,25 +233,39 @@ class AdjacencyMatrixGraph(AbstractGraph):
         max_edges = self.num_vertices * (self.num_vertices - 1)
         return self.num_edges == max_edges
 
+    def get_network_density(self):
+        """
+        Calcula a densidade do grafo
+        """
+        max_edges = self.num_vertices * (self.num_vertices - 1)
+        if max_edges == 0:
+            return 0.0
+        return self.num_edges / max_edges
+
     def is_connected(self):
         # Verifica conectividade no sentido fraco (ignorando direção) usando BFS
         # Para verificar se "o grafo é conectado"
         if self.num_vertices == 0: return True
-        
-        visited = [False] * self.num_vertices
-        queue = [0] # Começa do vértice 0
-        visited[0] = True
+        if self.track_components:
+            return self._component_index().count == 1
+        n = self.num_vertices
+
+        # A fronteira é expandida com operações sobre a linha e a coluna inteiras:
+        # cada vértice é representado por um byte de um inteiro grande
+        # (OR de linha|coluna e AND com os não visitados rodam em C)
+        not_visited = int.from_bytes(b'\x01' * n, 'little') ^ 1 # Começa do vértice 0
+        queue = [0]
         count_visited = 0
-        
+
         while queue:
-            u = queue.pop(0)
+            u = queue.pop()
             count_visited += 1
-            
-            for v in range(self.num_vertices):
-                # Verifica aresta em QUALQUER direção (u->v ou v->u) para conectividade fraca
-                if (self.matrix[u][v] != 0.0 or self.matrix[v][u] != 0.0):
-                    if not visited[v]:
-                        visited[v] = True
-                        queue.append(v)
-                        
-        return count_visited == self.num_vertices
\ No newline at end of file
+
+            # Verifica aresta em QUALQUER direção (u->v ou v->u) para conectividade fraca
+            neighbors = int.from_bytes(self._row_mask(u), 'little') | int.from_bytes(self._column_mask(u), 'little')
+            frontier = neighbors & not_visited
+            if frontier:
+                not_visited ^= frontier
+                queue.extend(self._set_positions(frontier.to_bytes(n, 'little')))
+
+        return count_visited == self.num_vertices
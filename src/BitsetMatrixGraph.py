@@ -0,0 +1,213 @@
+from src.AbstractGraph import AbstractGraph
+
+class BitsetMatrixGraph(AbstractGraph):
+    """
+    Matriz de adjacência sem pesos, para grafos em que só a presença importa
+    (ex: as camadas de comentários, fechamento de issues e revisões do main.py).
+    Estrutura: cada linha 'u' é um inteiro Python usado como conjunto de bits
+    (bit v ligado se existe u -> v) e cada coluna 'v' outro inteiro (bit u ligado).
+    São 2 bits por célula, contra 8 bytes de peso + 1 byte de máscara na matriz
+    ponderada; has_edge é um teste de bit, os graus são contagens de bits e as
+    buscas expandem a fronteira inteira com OR de linhas e colunas.
+    Não há pesos: toda aresta existente tem peso 1.0 (pesos passados a
+    add_edges_from são descartados; set_edge_weight só aceita 1).
+    """
+
+    def __init__(self, num_vertices=0, track_components=False):
+        super().__init__(num_vertices, track_components)
+        self.rows = [0] * num_vertices
+        self.columns = [0] * num_vertices
+        self.num_edges = 0
+
+    def _add_vertex_storage(self):
+        self.rows.append(0)
+        self.columns.append(0)
+
+    def get_edge_count(self):
+        return self.num_edges
+
+    def has_edge(self, u, v):
+        self.validate_index(u)
+        self.validate_index(v)
+        return (self.rows[u] >> v) & 1 == 1
+
+    def add_edge(self, u, v):
+        self.validate_index(u)
+        self.validate_index(v)
+        if u == v:
+            return # Não permite laços
+
+        if not (self.rows[u] >> v) & 1:
+            self.rows[u] |= 1 << v
+            self.columns[v] |= 1 << u
+            self.num_edges += 1
+            if self._components is not None:
+                self._components.union(u, v)
+            self._bump_epoch()
+
+    def add_edges_from(self, edges):
+        """
+        Inserção em lote de arestas (u, v) ou (u, v, peso); o peso é ignorado.
+        """
+        n = self.num_vertices
+        rows, columns = self.rows, self.columns
+        components = self._components
+        added = 0
+        try:
+            for edge in edges:
+                u, v = edge[0], edge[1]
+                if not (0 <= u < n and 0 <= v < n):
+                    raise ValueError(f"Índice de vértice inválido: {u if not 0 <= u < n else v}")
+                if u == v: continue # Sem laços
+
+                if not (rows[u] >> v) & 1:
+                    rows[u] |= 1 << v
+                    columns[v] |= 1 << u
+                    added += 1
+                    if components is not None:
+                        components.union(u, v)
+        finally:
+            # Mantém a contagem correta mesmo se um índice inválido interromper o lote
+            self.num_edges += added
+            self._bump_epoch()
+
+    def remove_edge(self, u, v):
+        if self.has_edge(u, v):
+            self.rows[u] &= ~(1 << v)
+            self.columns[v] &= ~(1 << u)
+            self.num_edges -= 1
+            self._invalidate_components()
+            self._bump_epoch()
+
+    def set_edge_weight(self, u, v, w):
+        """
+        Sem pesos: o único valor aceito é 1 (o peso de toda aresta); qualquer
+        outro levanta ValueError em vez de ser descartado em silêncio.
+        """
+        self.validate_index(u)
+        self.validate_index(v)
+        if w != 1:
+            raise ValueError(f"BitsetMatrixGraph não armazena pesos: {w} (use AdjacencyMatrixGraph)")
+
+    def get_edge_weight(self, u, v):
+        return 1.0 if self.has_edge(u, v) else 0.0
+
+    @staticmethod
+    def _bits(bitset):
+        """Posições dos bits ligados, da menor para a maior."""
+        while bitset:
+            lowest = bitset & -bitset
+            yield lowest.bit_length() - 1
+            bitset ^= lowest
+
+    def successors(self, u):
+        return self._bits(self.rows[u])
+
+    def predecessors(self, v):
+        return self._bits(self.columns[v])
+
+    def out_edges(self, u):
+        return ((v, 1.0) for v in self._bits(self.rows[u]))
+
+    def in_edges(self, v):
+        return ((u, 1.0) for u in self._bits(self.columns[v]))
+
+    def get_vertex_in_degree(self, u):
+        self.validate_index(u)
+        return self.columns[u].bit_count()
+
+    def get_vertex_out_degree(self, u):
+        self.validate_index(u)
+        return self.rows[u].bit_count()
+
+    def is_successor(self, u, v):
+        return self.has_edge(u, v)
+
+    def is_predecessor(self, u, v):
+        # Verifica se existe aresta V -> U (V é predecessor de U)
+        return self.has_edge(v, u)
+
+    def is_divergent(self, u1, v1, u2, v2):
+        # Verifica se as arestas (u1,v1) e (u2,v2) divergem da mesma origem
+        if not (self.has_edge(u1, v1) and self.has_edge(u2, v2)):
+            raise ValueError("Uma das arestas não existe.")
+        return u1 == u2 and v1 != v2
+
+    def is_convergent(self, u1, v1, u2, v2):
+        # Verifica se as arestas convergem para o mesmo destino
+        if not (self.has_edge(u1, v1) and self.has_edge(u2, v2)):
+            raise ValueError("Uma das arestas não existe.")
+        return v1 == v2 and u1 != u2
+
+    def is_incident(self, u, v, x):
+        # Verifica se x é uma das pontas da aresta (u, v)
+        if not self.has_edge(u, v):
+            return False
+        return x == u or x == v
+
+    def is_empty_graph(self):
+        return self.num_edges == 0
+
+    def is_complete_graph(self):
+        # Grafo completo simples direcionado: n*(n-1) arestas
+        return self.num_edges == self.num_vertices * (self.num_vertices - 1)
+
+    def get_network_density(self):
+        """
+        Calcula a densidade do grafo
+        """
+        max_edges = self.num_vertices * (self.num_vertices - 1)
+        if max_edges == 0:
+            return 0.0
+        return self.num_edges / max_edges
+
+    # --- Conectividade por operações de conjunto de bits ---
+
+    def _reach_undirected(self, start_bits, not_visited):
+        """
+        BFS ignorando a direção: a fronteira inteira é expandida com o OR das linhas e
+        colunas dos seus vértices e restrita aos não visitados com um AND.
+        Retorna o conjunto de bits alcançados (incluindo start_bits).
+        """
+        rows, columns = self.rows, self.columns
+        reached = frontier = start_bits
+        not_visited &= ~start_bits
+        while frontier:
+            neighbors = 0
+            for u in self._bits(frontier):
+                neighbors |= rows[u] | columns[u]
+            frontier = neighbors & not_visited
+            not_visited ^= frontier
+            reached |= frontier
+        return reached
+
+    def _bitset_components(self):
+        """Componentes fracamente conexas como conjuntos de bits, na ordem do menor ID."""
+        not_visited = (1 << self.num_vertices) - 1
+        components = []
+        while not_visited:
+            start = not_visited & -not_visited # menor vértice ainda não visitado
+            component = self._reach_undirected(start, not_visited)
+            not_visited &= ~component
+            components.append(component)
+        return components
+
+    def is_connected(self):
+        if self.num_vertices == 0: return True
+        if self.track_components:
+            return self._component_index().count == 1
+        everyone = (1 << self.num_vertices) - 1
+        return self._reach_undirected(1, everyone) == everyone
+
+    def get_component_count(self):
+        if self.track_components:
+            return self._component_index().count
+        return len(self._bitset_components())
+
+    def get_connected_components(self):
+        """
+        Componentes fracamente conexas.
+        Retorna: Uma lista de comunidades (cada uma é uma lista de rótulos de usuário).
+        """
+        return [[self.get_label(v) for v in self._bits(component)]
+                for component in self._bitset_components()]
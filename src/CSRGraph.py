@@ -0,0 +1,233 @@
+from src.AbstractGraph import AbstractGraph
+from src.AdjacencyListGraph import AdjacencyListGraph, _weight_class
+from array import array
+from bisect import bisect_left
+import json
+import mmap as mmap_module
+import struct
+
+class CSRGraph(AdjacencyListGraph):
+    """
+    Snapshot imutável em formato CSR (Compressed Sparse Row).
+    Estrutura: as arestas de saída de 'u' ficam em
+    out_targets[out_offsets[u]:out_offsets[u + 1]] (ordenadas por destino),
+    com os pesos na mesma faixa de out_weights. As arestas de entrada seguem
+    o mesmo esquema em in_offsets / in_sources / in_weights.
+    Herda todas as métricas de AdjacencyListGraph, que acessam as arestas
+    apenas por out_edges / in_edges.
+    """
+
+    # Snapshot binário: cabeçalho + seções alinhadas em 8 bytes, na ordem de
+    # SNAPSHOT_SECTIONS, seguidas dos rótulos em JSON (UTF-8).
+    SNAPSHOT_MAGIC = b'GRAFOCSR'
+    SNAPSHOT_VERSION = 1
+    # magic, versão, marcador de endianness, N, arestas, vértices rotulados, bytes dos rótulos
+    SNAPSHOT_HEADER = struct.Struct('=8sIIqqqq')
+    SNAPSHOT_SECTIONS = (
+        ('vertex_weights', 'd'),
+        ('out_offsets', 'q'), ('out_targets', 'i'), ('out_weights', 'd'),
+        ('in_offsets', 'q'), ('in_sources', 'i'), ('in_weights', 'd'),
+    )
+
+    def __init__(self, graph):
+        n = graph.num_vertices
+        # Não chama AdjacencyListGraph.__init__: não há dicionários de adjacência
+        AbstractGraph.__init__(self, n)
+        self.vertex_weights = array('d', graph.vertex_weights)
+        self.labels = list(graph.labels)
+        self.label_to_id = dict(graph.label_to_id)
+        self.count_vertices_used = graph.count_vertices_used
+        self._mmap = None
+        self._mmap_path = None
+        self._profile = None
+        self._last_pagerank = None
+        # Imutável: o union-find das componentes é montado uma vez, na primeira consulta
+        self.track_components = True
+
+        # Arestas de saída, linha a linha
+        self.out_offsets = array('q', [0])
+        self.out_targets = array('i')
+        self.out_weights = array('d')
+        for u in range(n):
+            for v, w in sorted(graph.out_edges(u)):
+                self.out_targets.append(v)
+                self.out_weights.append(w)
+            self.out_offsets.append(len(self.out_targets))
+        self.num_edges = len(self.out_targets)
+
+        # Arestas de entrada: counting sort das arestas de saída pelo destino
+        in_count = [0] * (n + 1)
+        for v in self.out_targets:
+            in_count[v + 1] += 1
+        for v in range(n):
+            in_count[v + 1] += in_count[v]
+        self.in_offsets = array('q', in_count)
+        self.in_sources = array('i', [0]) * self.num_edges
+        self.in_weights = array('d', [0.0]) * self.num_edges
+        next_slot = in_count[:n]
+        for u in range(n):
+            for k in range(self.out_offsets[u], self.out_offsets[u + 1]):
+                v = self.out_targets[k]
+                slot = next_slot[v]
+                self.in_sources[slot] = u
+                self.in_weights[slot] = self.out_weights[k]
+                next_slot[v] = slot + 1
+
+    def freeze(self):
+        return self
+
+    def _weight_profile(self):
+        # Imutável: classifica os pesos uma única vez (ver AdjacencyListGraph._weight_profile)
+        if self._profile is None:
+            classes = {_weight_class(w) for w in set(self.out_weights)}
+            self._profile = 'float' if 2 in classes else 'int' if 1 in classes else 'unit'
+        return self._profile
+
+    # --- Snapshot binário ---
+
+    def save(self, path):
+        """
+        Grava o grafo em um snapshot binário compacto: rótulos, pesos dos
+        vértices e os arrays CSR. Reabra com CSRGraph.load(path, mmap=True).
+        """
+        labels = json.dumps(self.labels, ensure_ascii=False).encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(self.SNAPSHOT_HEADER.pack(
+                self.SNAPSHOT_MAGIC, self.SNAPSHOT_VERSION, 0x01020304,
+                self.num_vertices, self.num_edges, self.count_vertices_used, len(labels)))
+            for name, _ in self.SNAPSHOT_SECTIONS:
+                # Funciona tanto para arrays quanto para seções mapeadas (memoryview)
+                f.write(memoryview(getattr(self, name)).cast('B'))
+                f.write(bytes(-f.tell() % 8)) # alinhamento
+            f.write(labels)
+
+    @classmethod
+    def load(cls, path, mmap=False):
+        """
+        Lê um snapshot gravado por save(). Com mmap=True os arrays de arestas
+        são mapeados direto do arquivo (sem cópia, somente leitura): a abertura
+        é quase instantânea e vários processos compartilham as mesmas páginas.
+        """
+        with open(path, 'rb') as f:
+            if mmap:
+                buffer = mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ)
+            else:
+                buffer = f.read()
+
+        header = cls.SNAPSHOT_HEADER
+        if len(buffer) < header.size:
+            raise ValueError(f"Arquivo não é um snapshot de grafo válido: {path}")
+        magic, version, byte_order, n, m, used, labels_size = header.unpack_from(buffer, 0)
+        if magic != cls.SNAPSHOT_MAGIC or byte_order != 0x01020304:
+            raise ValueError(f"Arquivo não é um snapshot de grafo válido: {path}")
+        if version != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Versão de snapshot não suportada: {version}")
+
+        graph = cls.__new__(cls)
+        AbstractGraph.__init__(graph, n)
+        graph.num_edges = m
+        graph.count_vertices_used = used
+
+        view = memoryview(buffer)
+        offset = header.size
+        lengths = {'vertex_weights': n, 'out_offsets': n + 1, 'in_offsets': n + 1}
+        for name, typecode in cls.SNAPSHOT_SECTIONS:
+            size = array(typecode).itemsize * lengths.get(name, m)
+            section = view[offset:offset + size]
+            setattr(graph, name, section.cast(typecode) if mmap else array(typecode, section.tobytes()))
+            offset += size + (-size % 8)
+
+        # Pesos dos vértices continuam editáveis (set_vertex_weight)
+        graph.vertex_weights = array('d', graph.vertex_weights)
+        graph.labels = json.loads(bytes(view[offset:offset + labels_size]).decode('utf-8'))
+        graph.label_to_id = {label: idx for idx, label in enumerate(graph.labels) if label is not None}
+        graph._mmap = buffer if mmap else None
+        graph._mmap_path = path if mmap else None
+        graph._profile = None
+        graph._last_pagerank = None
+        graph.track_components = True
+        return graph
+
+    def __getstate__(self):
+        # Seções mapeadas (memoryview) não são serializáveis: ao enviar o grafo para
+        # outro processo, apenas o caminho segue e o arquivo é mapeado de novo lá
+        state = super().__getstate__()
+        if self._mmap is not None:
+            for name, _ in self.SNAPSHOT_SECTIONS:
+                if name != 'vertex_weights':
+                    del state[name]
+            state['_mmap'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self._mmap_path is not None:
+            mapped = CSRGraph.load(self._mmap_path, mmap=True)
+            for name, _ in self.SNAPSHOT_SECTIONS:
+                if name != 'vertex_weights':
+                    setattr(self, name, getattr(mapped, name))
+            self._mmap = mapped._mmap
+
+    # --- Operações de escrita não suportadas ---
+
+    def _add_vertex_storage(self):
+        raise ValueError("CSRGraph é imutável: altere o grafo original e chame freeze() novamente.")
+
+    def add_edge(self, u, v):
+        raise ValueError("CSRGraph é imutável: altere o grafo original e chame freeze() novamente.")
+
+    def add_edges_from(self, edges):
+        raise ValueError("CSRGraph é imutável: altere o grafo original e chame freeze() novamente.")
+
+    def remove_edge(self, u, v):
+        raise ValueError("CSRGraph é imutável: altere o grafo original e chame freeze() novamente.")
+
+    def set_edge_weight(self, u, v, w):
+        raise ValueError("CSRGraph é imutável: altere o grafo original e chame freeze() novamente.")
+
+    # --- Consultas ---
+
+    def _find_edge(self, u, v):
+        """Posição da aresta u -> v em out_targets (busca binária), ou -1."""
+        start, end = self.out_offsets[u], self.out_offsets[u + 1]
+        k = bisect_left(self.out_targets, v, start, end)
+        if k < end and self.out_targets[k] == v:
+            return k
+        return -1
+
+    def has_edge(self, u, v):
+        self.validate_index(u)
+        self.validate_index(v)
+        return self._find_edge(u, v) >= 0
+
+    def get_edge_weight(self, u, v):
+        self.validate_index(u)
+        self.validate_index(v)
+        k = self._find_edge(u, v)
+        return self.out_weights[k] if k >= 0 else 0.0
+
+    def out_edges(self, u):
+        start, end = self.out_offsets[u], self.out_offsets[u + 1]
+        return zip(self.out_targets[start:end], self.out_weights[start:end])
+
+    def in_edges(self, v):
+        start, end = self.in_offsets[v], self.in_offsets[v + 1]
+        return zip(self.in_sources[start:end], self.in_weights[start:end])
+
+    def successors(self, u):
+        return iter(self.out_targets[self.out_offsets[u]:self.out_offsets[u + 1]])
+
+    def predecessors(self, v):
+        return iter(self.in_sources[self.in_offsets[v]:self.in_offsets[v + 1]])
+
+    def _in_edge_arrays(self):
+        # Os arrays de entrada já estão no formato esperado
+        return self.in_offsets, self.in_sources, self.in_weights
+
+    def get_vertex_in_degree(self, u):
+        self.validate_index(u)
+        return self.in_offsets[u + 1] - self.in_offsets[u]
+
+    def get_vertex_out_degree(self, u):
+        self.validate_index(u)
+        return self.out_offsets[u + 1] - self.out_offsets[u]
@@ -0,0 +1,55 @@
+from array import array
+
+class UnionFind:
+    """
+    Estrutura de conjuntos disjuntos (union-find) para a conectividade fraca.
+    União por tamanho e compressão de caminho por halving: find e union custam
+    O(α(N)) amortizado, praticamente constante.
+    Estrutura: 'parent' e 'size' são arrays de inteiros indexados pelo ID do vértice.
+    """
+
+    def __init__(self, num_elements=0):
+        self.parent = array('q', range(num_elements))
+        self.size = array('q', [1]) * num_elements
+        self.count = num_elements # Quantidade de conjuntos (componentes)
+
+    def add(self):
+        """Acrescenta um elemento isolado ao final e retorna seu ID."""
+        idx = len(self.parent)
+        self.parent.append(idx)
+        self.size.append(1)
+        self.count += 1
+        return idx
+
+    def find(self, x):
+        """Representante do conjunto de x."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]] # halving: aponta para o avô
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        """Une os conjuntos de a e b. Retorna True se eram conjuntos diferentes."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        self.count -= 1
+        return True
+
+    def connected(self, a, b):
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x):
+        return self.size[self.find(x)]
+
+    def groups(self):
+        """Conjuntos como listas de IDs crescentes, na ordem do menor ID de cada um."""
+        members = {}
+        for x in range(len(self.parent)):
+            members.setdefault(self.find(x), []).append(x)
+        return list(members.values())